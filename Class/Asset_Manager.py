@@ -0,0 +1,267 @@
+# classes/asset_manager.py
+import json
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+
+def resolve_path(base_dir, relative_path):
+    """
+    Cari file tanpa peduli huruf besar/kecil (Asset/Image/Player.png -> Asset/image/player.png)
+    Return path asli di disk, atau None kalau tidak ada
+    """
+    path = base_dir
+    for part in relative_path.replace("\\", "/").split("/"):
+        candidate = os.path.join(path, part)
+        if os.path.exists(candidate):
+            path = candidate
+            continue
+        try:
+            matches = [name for name in os.listdir(path) if name.lower() == part.lower()]
+        except OSError:
+            return None
+        if not matches:
+            return None
+        path = os.path.join(path, sorted(matches)[0])
+    return path
+
+
+def _decode_sprite(path, sizes):
+    """Dijalankan di thread pool: decode PNG + scale (tanpa convert, itu harus di main thread)"""
+    source = pygame.image.load(path)
+    return {size: pygame.transform.scale(source, size) for size in sizes}
+
+
+class AssetManager:
+    """
+    Class untuk load sprite dari manifest (Asset/manifest.json)
+    - Nama file tidak case-sensitive (aman di Linux)
+    - Kalau ada atlas hasil Tools/build_atlas.py, semua sprite diambil dari satu gambar
+    - Sprite yang di-scale disimpan per (nama, ukuran), dibatasi memory budget
+    - load_async() decode PNG di background thread, poll_loaded() di main thread
+    """
+
+    def __init__(self, asset_dir="Asset", manifest_name="manifest.json", memory_budget=32 * 1024 * 1024, log=print):
+        self.asset_dir = asset_dir
+        self.memory_budget = memory_budget  # Byte untuk sprite yang di-scale saat runtime
+        self.__log = log
+        self.__atlas = {}  # {(nama, (w, h)): Surface} dari atlas, tidak pernah dibuang
+        self.__cache = OrderedDict()  # {(nama, (w, h) / None): Surface} LRU
+        self.__cache_bytes = 0
+        self.__missing = set()  # Sprite yang gagal diload (tidak dicoba ulang)
+        self.__executor = None
+        self.__pending = {}  # {nama: Future} yang masih di-decode di background
+        self.__async_total = 0
+        self.__async_done = 0
+
+        manifest_path = resolve_path(asset_dir, manifest_name)
+        if manifest_path is None:
+            self.__log(f"[!] Asset manifest not found in {asset_dir}")
+            self.manifest = {"image_dir": "", "sprites": {}}
+        else:
+            with open(manifest_path, encoding="utf-8") as file:
+                self.manifest = json.load(file)
+
+    # ===== Manifest =====
+    def get_sprite_names(self):
+        return list(self.manifest["sprites"])
+
+    def get_requested_sizes(self, name):
+        return [tuple(size) for size in self.manifest["sprites"][name].get("sizes", [])]
+
+    def get_source_path(self, name):
+        sprite = self.manifest["sprites"].get(name)
+        if sprite is None:
+            return None
+        return resolve_path(self.asset_dir, os.path.join(self.manifest.get("image_dir", ""), sprite["file"]))
+
+    # ===== Atlas =====
+    def load_atlas(self):
+        """Load atlas (satu kali decode PNG). Return True kalau berhasil"""
+        image_path = resolve_path(self.asset_dir, self.manifest.get("atlas", "atlas.png"))
+        index_path = resolve_path(self.asset_dir, self.manifest.get("atlas_index", "atlas.json"))
+        if image_path is None or index_path is None:
+            return False
+
+        try:
+            with open(index_path, encoding="utf-8") as file:
+                index = json.load(file)
+            atlas = pygame.image.load(image_path)
+            if pygame.display.get_surface() is not None:
+                atlas = atlas.convert_alpha()
+        except (OSError, ValueError, pygame.error) as e:
+            self.__log(f"[X] Could not load atlas: {e}")
+            return False
+
+        for entry in index["entries"]:
+            key = (entry["name"], tuple(entry["size"]))
+            sprite = atlas.subsurface(pygame.Rect(entry["rect"]))
+            if self.__is_opaque(entry["name"]) and pygame.display.get_surface() is not None:
+                sprite = sprite.convert()  # Background tanpa alpha lebih cepat di-blit
+            self.__atlas[key] = sprite
+        self.__log(f"[OK] Loaded atlas: {len(self.__atlas)} sprites")
+        return True
+
+    # ===== Sprite =====
+    def get(self, name, size=None):
+        """Return Surface sprite dengan ukuran tertentu, atau None kalau tidak ada"""
+        key = (name, tuple(size) if size else None)
+        if key in self.__atlas:
+            return self.__atlas[key]
+
+        surface = self.__cache.get(key)
+        if surface is not None:
+            self.__cache.move_to_end(key)
+            return surface
+        if name in self.__missing or name in self.__pending:
+            return None  # Belum siap, pakai fallback dulu
+
+        if size:
+            source = self.get(name)
+            if source is None:
+                return None
+            surface = pygame.transform.scale(source, key[1])
+        else:
+            surface = self.__load_source(name)
+            if surface is None:
+                return None
+
+        self.__store(key, surface)
+        return surface
+
+    # ===== Background loading =====
+    def load_async(self, sprite_sizes, max_workers=4):
+        """
+        Mulai decode sprite di thread pool
+        sprite_sizes: {nama: (w, h)} atau {nama: [(w, h), ...]}
+        """
+        for name, sizes in sprite_sizes.items():
+            sizes = [tuple(sizes)] if isinstance(sizes[0], int) else [tuple(size) for size in sizes]
+            sizes = [size for size in sizes if (name, size) not in self.__atlas and (name, size) not in self.__cache]
+            if not sizes or name in self.__pending or name in self.__missing:
+                continue
+
+            path = self.get_source_path(name)
+            if path is None:
+                self.__log(f"[!] Image not found: {name}")
+                self.__missing.add(name)
+                continue
+
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="asset")
+            self.__pending[name] = self.__executor.submit(_decode_sprite, path, sizes)
+            self.__async_total += 1
+
+    def poll_loaded(self):
+        """
+        Dipanggil tiap frame di main thread: convert sprite yang sudah selesai di-decode
+        Return jumlah sprite yang baru siap
+        """
+        finished = [name for name, future in self.__pending.items() if future.done()]
+        for name in finished:
+            future = self.__pending.pop(name)
+            self.__async_done += 1
+            try:
+                surfaces = future.result()
+            except (OSError, pygame.error) as e:
+                self.__log(f"[X] Could not load image: {name}")
+                self.__log(f"    Error: {e}")
+                self.__missing.add(name)
+                continue
+
+            for size, surface in surfaces.items():
+                self.__store((name, size), self.__prepare(surface, self.__is_opaque(name)))
+            self.__log(f"[OK] Loaded: {name}")
+        return len(finished)
+
+    def get_progress(self):
+        """Return (selesai, total) untuk loading di background"""
+        return self.__async_done, self.__async_total
+
+    def is_loading(self):
+        return bool(self.__pending)
+
+    def shutdown(self):
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False, cancel_futures=True)
+            self.__executor = None
+
+    def __load_source(self, name):
+        path = self.get_source_path(name)
+        if path is None:
+            self.__log(f"[!] Image not found: {name}")
+            self.__missing.add(name)
+            return None
+        try:
+            surface = self.__prepare(pygame.image.load(path), self.__is_opaque(name))
+        except pygame.error as e:
+            self.__log(f"[X] Could not load image: {path}")
+            self.__log(f"    Error: {e}")
+            self.__missing.add(name)
+            return None
+        self.__log(f"[OK] Loaded: {path}")
+        return surface
+
+    def __is_opaque(self, name):
+        return self.manifest["sprites"].get(name, {}).get("opaque", False)
+
+    def __prepare(self, surface, opaque=False):
+        # convert/convert_alpha butuh display sudah dibuat
+        if pygame.display.get_surface() is None:
+            return surface
+        return surface.convert() if opaque else surface.convert_alpha()
+
+    def __store(self, key, surface):
+        self.__cache[key] = surface
+        self.__cache_bytes += surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+        # Buang sprite yang paling lama tidak dipakai kalau melebihi budget
+        while self.__cache_bytes > self.memory_budget and len(self.__cache) > 1:
+            old_key, old_surface = self.__cache.popitem(last=False)
+            self.__cache_bytes -= old_surface.get_width() * old_surface.get_height() * old_surface.get_bytesize()
+
+    def get_stats(self):
+        return {
+            'atlas_sprites': len(self.__atlas),
+            'cached_sprites': len(self.__cache),
+            'cached_bytes': self.__cache_bytes,
+            'memory_budget': self.memory_budget
+        }
+
+
+def build_atlas(asset_manager, padding=1):
+    """
+    Gabungkan semua sprite dari manifest (sudah di-scale) jadi satu gambar
+    Return (Surface atlas, index dict) untuk disimpan ke disk
+    """
+    sprites = []
+    for name in asset_manager.get_sprite_names():
+        for size in asset_manager.get_requested_sizes(name):
+            surface = asset_manager.get(name, size)
+            if surface is not None:
+                sprites.append((name, size, surface))
+
+    # Shelf packing: urutkan dari yang paling tinggi
+    sprites.sort(key=lambda sprite: sprite[1][1], reverse=True)
+    atlas_width = max([size[0] for name, size, surface in sprites] + [256])
+    placements = []
+    x = y = shelf_height = 0
+    for name, size, surface in sprites:
+        if x + size[0] > atlas_width:
+            x = 0
+            y += shelf_height + padding
+            shelf_height = 0
+        placements.append((name, size, surface, (x, y, size[0], size[1])))
+        x += size[0] + padding
+        shelf_height = max(shelf_height, size[1])
+
+    atlas = pygame.Surface((atlas_width, max(1, y + shelf_height)), pygame.SRCALPHA)
+    entries = []
+    for name, size, surface, rect in placements:
+        # BLEND_RGBA_MAX ke atlas kosong = copy pixel persis (termasuk alpha)
+        atlas.blit(surface, rect[:2], special_flags=pygame.BLEND_RGBA_MAX)
+        entries.append({"name": name, "size": list(size), "rect": list(rect)})
+
+    return atlas, {"version": 1, "entries": entries}
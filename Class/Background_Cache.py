@@ -0,0 +1,80 @@
+# classes/background_cache.py
+import pygame
+
+# NumPy opsional, kalau tidak ada pakai draw.line biasa (tetap cuma sekali)
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class BackgroundCache:
+    """
+    Class untuk menyimpan background gradient (fallback kalau tidak ada gambar)
+    Background dibuat sekali per resolusi, setelah itu cukup di-blit
+    """
+
+    def __init__(self):
+        self.__surfaces = {}  # {(width, height): Surface}
+
+    def get(self, width, height):
+        """Ambil background untuk resolusi tertentu, buat kalau belum ada"""
+        key = (width, height)
+        if key not in self.__surfaces:
+            self.__surfaces[key] = self.__build(width, height)
+        return self.__surfaces[key]
+
+    def clear(self):
+        self.__surfaces = {}
+
+    def __build(self, width, height):
+        """Private method untuk menggambar langit, rumput dan awan"""
+        horizon = height * 2 // 3  # 400 di layar 800x600
+
+        if numpy is not None:
+            surface = self.__build_gradient_numpy(width, height, horizon)
+        else:
+            surface = self.__build_gradient_lines(width, height, horizon)
+
+        # Tambah clouds (awan sederhana), posisi mengikuti layar 800x600
+        cloud_surface = pygame.Surface((100, 40))
+        cloud_surface.set_alpha(100)
+        cloud_surface.fill((255, 255, 255))
+        for cloud_x, cloud_y in [(100, 80), (300, 50), (500, 100), (650, 70)]:
+            surface.blit(cloud_surface, (cloud_x * width // 800, cloud_y * height // 600))
+
+        # Samakan format dengan layar supaya blit cepat
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
+
+    def __build_gradient_numpy(self, width, height, horizon):
+        ys = numpy.arange(height, dtype=numpy.float64)
+        colors = numpy.empty((height, 3), dtype=numpy.uint8)
+
+        # Gradient dari biru langit ke biru muda
+        sky = ys[:horizon]
+        colors[:horizon, 0] = 100
+        colors[:horizon, 1] = (135 + (sky / horizon) * 60).astype(numpy.uint8)
+        colors[:horizon, 2] = 255
+
+        # Gradient hijau
+        grass = ys[horizon:]
+        colors[horizon:, 0] = 50
+        colors[horizon:, 1] = (180 - ((grass - horizon) / (height - horizon)) * 50).astype(numpy.uint8)
+        colors[horizon:, 2] = 50
+
+        # surfarray pakai urutan (x, y, rgb)
+        pixels = numpy.broadcast_to(colors[numpy.newaxis, :, :], (width, height, 3))
+        return pygame.surfarray.make_surface(numpy.ascontiguousarray(pixels))
+
+    def __build_gradient_lines(self, width, height, horizon):
+        surface = pygame.Surface((width, height))
+        for y in range(horizon):
+            blue_val = int(135 + (y / horizon) * 60)
+            pygame.draw.line(surface, (100, blue_val, 255), (0, y), (width, y))
+
+        for y in range(horizon, height):
+            green_val = int(180 - ((y - horizon) / (height - horizon)) * 50)
+            pygame.draw.line(surface, (50, green_val, 50), (0, y), (width, y))
+        return surface
@@ -0,0 +1,60 @@
+# classes/bot_player.py
+import random
+
+
+class BotPlayer:
+    """
+    Pemain otomatis untuk load test dan simulasi
+    Menghasilkan input yang sama dengan main.py: keys [UP, DOWN, LEFT, RIGHT] + answer_index
+    - Bergerak ke monster terdekat (lewat GameManager.move_player -> Player.move_with_keys)
+    - Menjawab soal setelah waktu reaksi acak (normal, detik), benar dengan peluang accuracy
+    """
+
+    def __init__(self, accuracy=0.8, reaction_mean=2.0, reaction_sd=0.75, rng=None, tick_rate=60):
+        self.accuracy = accuracy
+        self.reaction_mean = reaction_mean
+        self.reaction_sd = reaction_sd
+        self.rng = rng if rng is not None else random.Random()
+        self.tick_rate = tick_rate
+        self.__question = None  # Soal yang sedang "dipikirkan"
+        self.__answer_index = None
+        self.__ticks_left = 0
+
+    def decide(self, game_manager):
+        """Return (keys, answer_index) untuk satu tick"""
+        if game_manager.game_state == "QUESTION":
+            return None, self.__think(game_manager.current_question)
+        self.__question = None
+        if game_manager.game_state != "PLAYING":
+            return None, None
+        return self.__chase(game_manager), None
+
+    def __chase(self, game_manager):
+        player_x, player_y = game_manager.player.get_position()
+        if not game_manager.monsters:
+            return [False, False, False, False]
+
+        target_x, target_y = min((monster.get_position() for monster in game_manager.monsters),
+                                 key=lambda position: (position[0] - player_x)**2 + (position[1] - player_y)**2)
+        # Tidak menekan tombol kalau sudah dekat (monster juga mendekat), supaya tidak bolak-balik
+        speed = game_manager.player.get_speed()
+        return [target_y < player_y - speed, target_y > player_y + speed,
+                target_x < player_x - speed, target_x > player_x + speed]
+
+    def __think(self, question):
+        if question is not self.__question:
+            self.__question = question
+            reaction = max(0.0, self.rng.gauss(self.reaction_mean, self.reaction_sd))
+            self.__ticks_left = int(reaction * self.tick_rate)
+            options = question.get_options()
+            correct = options.index(question.get_correct_answer())
+            if self.rng.random() < self.accuracy:
+                self.__answer_index = correct
+            else:
+                self.__answer_index = self.rng.choice([i for i in range(len(options)) if i != correct])
+
+        if self.__ticks_left > 0:
+            self.__ticks_left -= 1
+            return None
+        answer_index, self.__answer_index = self.__answer_index, None
+        return answer_index
@@ -2,6 +2,9 @@
 from abc import ABC, abstractmethod
 
 class Character(ABC):
+    # __slots__: tanpa __dict__ per object, hemat memory kalau monster sangat banyak
+    __slots__ = ("_name", "__health", "_x", "_y", "_is_alive")
+    
     def __init__(self, name, health, x, y):
         self._name = name  # Protected attribute
         self.__health = health  # Private attribute (Encapsulation)
@@ -0,0 +1,58 @@
+# classes/cooldown_timer.py
+import heapq
+
+
+class CooldownTimer:
+    """
+    Class cooldown berbasis deadline (frame absolut) + heap
+    Tidak perlu mengurangi semua cooldown setiap frame,
+    yang diproses hanya cooldown yang sudah habis
+    """
+
+    def __init__(self):
+        self.now = 0  # Frame sekarang
+        self.__deadlines = {}  # {handle: frame_selesai}
+        self.__heap = []  # [(frame_selesai, handle)]
+
+    def tick(self, frames=1):
+        """Majukan waktu dan buang cooldown yang sudah habis"""
+        self.now += frames
+        while self.__heap and self.__heap[0][0] <= self.now:
+            deadline, handle = heapq.heappop(self.__heap)
+            # Entry lama (cooldown sudah di-set ulang / dibatalkan) dilewati
+            if self.__deadlines.get(handle) == deadline:
+                del self.__deadlines[handle]
+
+    def start(self, handle, duration):
+        deadline = self.now + duration
+        self.__deadlines[handle] = deadline
+        heapq.heappush(self.__heap, (deadline, handle))
+
+    def cancel(self, handle):
+        self.__deadlines.pop(handle, None)
+
+    def is_active(self, handle):
+        deadline = self.__deadlines.get(handle)
+        return deadline is not None and deadline > self.now
+
+    def get_remaining(self, handle):
+        deadline = self.__deadlines.get(handle)
+        if deadline is None:
+            return 0
+        return max(0, deadline - self.now)
+
+    def clear(self):
+        self.now = 0
+        self.__deadlines = {}
+        self.__heap = []
+
+    def items(self):
+        """Return list (handle, sisa_frame) yang masih aktif"""
+        return [(handle, deadline - self.now) for handle, deadline in self.__deadlines.items()
+                if deadline > self.now]
+
+    def __len__(self):
+        return len(self.__deadlines)
+
+    def __contains__(self, handle):
+        return self.is_active(handle)
@@ -0,0 +1,73 @@
+# classes/dirty_renderer.py
+import pygame
+
+
+class DirtyRenderer:
+    """
+    Class untuk mengirim ke layar hanya area yang berubah (dirty rectangle)
+    Setiap elemen (player, monster, HUD, timer) didaftarkan dengan track()
+    """
+
+    def __init__(self, screen_width, screen_height, use_flip=False):
+        self.__screen_rect = pygame.Rect(0, 0, screen_width, screen_height)
+        self.use_flip = use_flip  # True = selalu full flip seperti dulu
+        self.__previous = {}  # {key: (rect, signature)} frame sebelumnya
+        self.__current = {}
+        self.__state = None
+        self.__full_redraw = True
+        self.__last_dirty = []
+
+    def begin_frame(self, game_state):
+        """Dipanggil sebelum menggambar frame baru"""
+        self.__current = {}
+        if game_state != self.__state:
+            # Ganti layar = semua berubah
+            self.__state = game_state
+            self.__full_redraw = True
+
+    def track(self, key, rect, signature=None):
+        """
+        Daftarkan elemen yang digambar frame ini
+        signature = nilai yang kalau berubah berarti isinya berubah (mis. teks stat)
+        """
+        self.__current[key] = (pygame.Rect(rect), signature)
+
+    def invalidate(self):
+        """Paksa full redraw di frame berikutnya"""
+        self.__full_redraw = True
+
+    def get_dirty_rects(self):
+        dirty = []
+
+        for key, (rect, signature) in self.__current.items():
+            previous = self.__previous.get(key)
+            if previous is None:
+                dirty.append(rect)
+            elif previous[0] != rect:
+                # Pindah posisi: hapus posisi lama + gambar posisi baru
+                dirty.append(previous[0].union(rect))
+            elif previous[1] != signature:
+                dirty.append(rect)
+
+        # Elemen yang hilang (monster mati) perlu dihapus dari layar
+        for key, (rect, signature) in self.__previous.items():
+            if key not in self.__current:
+                dirty.append(rect)
+
+        return [rect.clip(self.__screen_rect) for rect in dirty]
+
+    def present(self):
+        """Pengganti pygame.display.flip()"""
+        if self.use_flip or self.__full_redraw:
+            pygame.display.flip()
+            self.__last_dirty = [self.__screen_rect]
+        else:
+            self.__last_dirty = self.get_dirty_rects()
+            if self.__last_dirty:
+                pygame.display.update(self.__last_dirty)
+
+        self.__previous = self.__current
+        self.__full_redraw = False
+
+    def get_last_dirty_rects(self):
+        return self.__last_dirty
@@ -0,0 +1,97 @@
+# classes/entity_store.py
+# NumPy opsional, hanya dibutuhkan kalau GameManager(use_entity_store=True)
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class MonsterStore:
+    """
+    Class struct-of-arrays untuk data monster (x, y, speed, difficulty, health, alive)
+    Object Monster/Boss tetap dipakai, tapi hanya sebagai "view" ke array ini
+    Semua monster bergerak dan dicek collision-nya dalam satu operasi NumPy
+    """
+
+    def __init__(self, capacity=64):
+        if numpy is None:
+            raise ImportError("MonsterStore membutuhkan numpy (pip install numpy)")
+
+        self.count = 0  # Slot 0..count-1 terpakai (selalu rapat)
+        self.x = numpy.zeros(capacity, dtype=numpy.int64)
+        self.y = numpy.zeros(capacity, dtype=numpy.int64)
+        self.speed = numpy.zeros(capacity, dtype=numpy.int64)
+        self.difficulty = numpy.zeros(capacity, dtype=numpy.int64)
+        self.health = numpy.zeros(capacity, dtype=numpy.int64)
+        self.alive = numpy.zeros(capacity, dtype=bool)
+        self.__monsters = []  # monsters[slot] = object Monster
+
+    def __len__(self):
+        return self.count
+
+    def __grow(self):
+        capacity = len(self.x) * 2
+        for name in ('x', 'y', 'speed', 'difficulty', 'health', 'alive'):
+            old = getattr(self, name)
+            new = numpy.zeros(capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def add(self, monster):
+        """Pindahkan data monster ke array, monster jadi view ke slot-nya"""
+        if self.count == len(self.x):
+            self.__grow()
+
+        slot = self.count
+        self.x[slot], self.y[slot] = monster.get_position()
+        self.speed[slot] = monster.get_speed()
+        self.difficulty[slot] = monster.get_difficulty()
+        self.health[slot] = monster.get_health()
+        self.alive[slot] = monster.is_alive()
+        self.__monsters.append(monster)
+        self.count += 1
+
+        monster.attach_store(self, slot)
+        return slot
+
+    def remove(self, monster):
+        """Hapus monster (swap dengan slot terakhir supaya array tetap rapat)"""
+        slot = monster.get_slot()
+        if slot is None or self.__monsters[slot] is not monster:
+            return
+
+        # Kembalikan data ke object supaya monster tetap bisa dipakai
+        monster.detach_store()
+
+        last = self.count - 1
+        if slot != last:
+            for array in (self.x, self.y, self.speed, self.difficulty, self.health, self.alive):
+                array[slot] = array[last]
+            moved = self.__monsters[last]
+            self.__monsters[slot] = moved
+            moved.attach_store(self, slot)
+
+        self.__monsters.pop()
+        self.count -= 1
+
+    def clear(self):
+        for monster in self.__monsters:
+            monster.detach_store()
+        self.__monsters = []
+        self.count = 0
+
+    def move_towards(self, target_x, target_y):
+        """Versi vectorized dari Monster.move_towards_player untuk semua monster"""
+        n = self.count
+        step = self.speed[:n] * self.alive[:n]
+        # sign() = +1 kalau di kiri/atas target, -1 kalau di kanan/bawah, 0 kalau sama
+        self.x[:n] += numpy.sign(target_x - self.x[:n]) * step
+        self.y[:n] += numpy.sign(target_y - self.y[:n]) * step
+
+    def find_colliding(self, target_x, target_y, radius):
+        """Return list monster hidup yang jaraknya < radius dari (target_x, target_y)"""
+        n = self.count
+        dx = self.x[:n] - target_x
+        dy = self.y[:n] - target_y
+        hit = (dx * dx + dy * dy < radius * radius) & self.alive[:n]
+        return [self.__monsters[slot] for slot in numpy.flatnonzero(hit)]
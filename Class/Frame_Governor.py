@@ -0,0 +1,69 @@
+# classes/frame_governor.py
+import pygame
+
+
+class FrameGovernor:
+    """
+    Class untuk menghemat CPU di layar yang jarang berubah
+    - MENU, GAME_OVER, WIN: digambar sekali ke surface cache, loop menunggu input (event.wait)
+    - QUESTION: hanya digambar ulang kalau signature (soal, sisa detik) berubah
+    """
+
+    STATIC_STATES = ("MENU", "GAME_OVER", "WIN")
+
+    def __init__(self, idle_wait_ms=500):
+        self.idle_wait_ms = idle_wait_ms  # Tetap bangun sesekali walaupun tidak ada input
+        self.__cache = {}  # {state: (signature, Surface)}
+        self.__shown = None  # (state, signature) yang sedang ada di layar
+        self.__redraws = 0
+        self.__skips = 0
+
+    def is_static(self, game_state):
+        return game_state in self.STATIC_STATES
+
+    def invalidate(self):
+        """Buang semua cache (mis. sprite baru selesai diload)"""
+        self.__cache = {}
+        self.__shown = None
+
+    def forget_shown(self):
+        """
+        Layar ditimpa gambar lain di luar governor (mis. frame PLAYING)
+        Layar statis berikutnya disalin ulang dari cache walaupun signature-nya sama
+        """
+        self.__shown = None
+
+    def draw(self, surface, game_state, draw, signature=None, restore=False):
+        """
+        Gambar layar hanya kalau perlu
+        restore=True: layar sudah ditimpa (mis. overlay profiler), salin ulang dari cache
+        Return True kalau layar berubah
+        """
+        key = (game_state, signature)
+        cached = self.__cache.get(game_state)
+
+        if cached is None or cached[0] != signature:
+            draw()
+            self.__cache[game_state] = (signature, surface.copy())
+        elif self.__shown != key or restore:
+            surface.blit(cached[1], (0, 0))
+        else:
+            self.__skips += 1
+            return False
+
+        self.__shown = key
+        self.__redraws += 1
+        return True
+
+    def wait_events(self):
+        """Blok sampai ada event (atau idle_wait_ms habis), return list event"""
+        event = pygame.event.wait(self.idle_wait_ms)
+        events = [event] if event.type != pygame.NOEVENT else []
+        return events + pygame.event.get()
+
+    def get_stats(self):
+        return {
+            'redraws': self.__redraws,
+            'skipped': self.__skips,
+            'cached_screens': len(self.__cache)
+        }
@@ -0,0 +1,136 @@
+# classes/frame_profiler.py
+import csv
+import json
+import time
+from collections import deque
+from itertools import islice
+
+import pygame
+
+
+class FrameProfiler:
+    """
+    Class untuk mengukur waktu setiap bagian frame (events, update, draw_*, present)
+    Dipanggil berurutan: begin_frame() -> mark("fase") ... -> end_frame()
+    Kalau tidak aktif, semua method langsung return (overhead hampir nol)
+    """
+
+    def __init__(self, history=240, enabled=False, max_frames=36000, text_interval=15):
+        self.enabled = enabled
+        self.__history = deque(maxlen=history)  # Total ms frame terakhir, untuk grafik
+        # [(frame, state, {fase: ms})] untuk export, dibatasi (36000 = 10 menit di 60 FPS)
+        self.__frames = deque(maxlen=max_frames)
+        self.__phase_totals = {}  # {fase: [total_ms, jumlah]}
+        self.__frame_index = 0
+        self.__current = None
+        self.__last = 0.0
+        
+        # Overlay: panel dibuat sekali, teks hanya di-render ulang kalau isinya berubah
+        self.text_interval = text_interval  # Angka di overlay dihitung ulang setiap N frame
+        self.__panel = None
+        self.__lines = []  # [(teks, Surface)]
+        self.__overlay_frames = 0
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        return self.enabled
+
+    def begin_frame(self):
+        self.__frame_index += 1
+        if not self.enabled:
+            return
+        self.__current = {}
+        self.__last = time.perf_counter()
+
+    def mark(self, phase):
+        """Catat waktu sejak mark sebelumnya sebagai fase ini"""
+        if not self.enabled or self.__current is None:
+            return
+        now = time.perf_counter()
+        self.__current[phase] = self.__current.get(phase, 0.0) + (now - self.__last) * 1000
+        self.__last = now
+
+    def end_frame(self, game_state):
+        if not self.enabled or self.__current is None:
+            return
+        phases = self.__current
+        self.__current = None
+
+        self.__history.append(sum(phases.values()))
+        self.__frames.append((self.__frame_index, game_state, phases))
+        for phase, ms in phases.items():
+            totals = self.__phase_totals.setdefault(phase, [0.0, 0])
+            totals[0] += ms
+            totals[1] += 1
+
+    # ===== Statistik =====
+    def get_percentiles(self, percentiles=(50, 95, 99)):
+        """Return {persen: ms} dari frame di history"""
+        if not self.__history:
+            return {}
+        values = sorted(self.__history)
+        return {p: values[int(p / 100 * (len(values) - 1))] for p in percentiles}
+
+    def get_phase_averages(self):
+        return {phase: total / count for phase, (total, count) in self.__phase_totals.items()}
+
+    def has_data(self):
+        return bool(self.__frames)
+
+    # ===== Overlay =====
+    def draw_overlay(self, surface, font, x=540, y=10, width=250, height=150, budget_ms=1000 / 60):
+        """Gambar grafik frame time + percentile di pojok layar. Return rect yang digambar"""
+        rect = pygame.Rect(x, y, width, height)
+        if self.__panel is None or self.__panel.get_size() != rect.size:
+            self.__panel = pygame.Surface(rect.size)
+            self.__panel.fill((0, 0, 0))
+            self.__panel.set_alpha(200)
+        surface.blit(self.__panel, rect.topleft)
+
+        # Grafik: 1 batang per frame, skala 2x budget
+        graph = pygame.Rect(x + 5, y + 5, width - 10, 60)
+        scale = graph.height / (budget_ms * 2)
+        skip = max(0, len(self.__history) - graph.width)
+        for i, ms in enumerate(islice(self.__history, skip, None)):
+            bar_height = min(graph.height, int(ms * scale))
+            color = (0, 200, 0) if ms <= budget_ms else (255, 60, 60)
+            pygame.draw.line(surface, color, (graph.x + i, graph.bottom), (graph.x + i, graph.bottom - bar_height))
+        budget_y = graph.bottom - int(budget_ms * scale)
+        pygame.draw.line(surface, (255, 255, 0), (graph.x, budget_y), (graph.right, budget_y))
+
+        if self.__overlay_frames % self.text_interval == 0:
+            self.__update_lines(font)
+        self.__overlay_frames += 1
+
+        text_y = graph.bottom + 4
+        for _, text in self.__lines:
+            surface.blit(text, (x + 5, text_y))
+            text_y += 15
+        return rect
+
+    def __update_lines(self, font):
+        lines = ["  ".join(f"p{p} {ms:.1f}" for p, ms in self.get_percentiles().items()) + " ms"]
+        averages = sorted(self.get_phase_averages().items(), key=lambda item: item[1], reverse=True)
+        lines += [f"{phase}: {ms:.2f} ms" for phase, ms in averages[:4]]
+
+        old = self.__lines
+        self.__lines = [old[i] if i < len(old) and old[i][0] == line else (line, font.render(line, True, (255, 255, 255)))
+                        for i, line in enumerate(lines)]
+
+    # ===== Export =====
+    def export_csv(self, path):
+        phases = sorted({phase for _, _, frame_phases in self.__frames for phase in frame_phases})
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(["frame", "state", "total_ms"] + phases)
+            for frame, state, frame_phases in self.__frames:
+                row = [frame, state, round(sum(frame_phases.values()), 4)]
+                row += [round(frame_phases.get(phase, 0.0), 4) for phase in phases]
+                writer.writerow(row)
+
+    def export_jsonl(self, path):
+        with open(path, "w", encoding="utf-8") as file:
+            for frame, state, frame_phases in self.__frames:
+                record = {"frame": frame, "state": state, "total_ms": round(sum(frame_phases.values()), 4)}
+                record["phases"] = {phase: round(ms, 4) for phase, ms in frame_phases.items()}
+                file.write(json.dumps(record) + "\n")
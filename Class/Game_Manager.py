@@ -1,14 +1,23 @@
 # classes/game_manager.py
-import pygame
+# Tidak import pygame supaya bisa jalan headless (CI / server)
 from Class.Player import Player
 from Class.Monster import Monster, Boss
 from Class.Question import Question
+from Class.Spatial_Grid import SpatialGrid
+from Class.Entity_Store import MonsterStore
+from Class.Cooldown_Timer import CooldownTimer
 import random
+import zlib
 
 class GameManager:
-    def __init__(self, screen_width=800, screen_height=600):
+    def __init__(self, screen_width=800, screen_height=600, verbose=True, grid_cell_size=100,
+                 use_entity_store=False, tick_rate=60):
         self.screen_width = screen_width
         self.screen_height = screen_height
+        
+        # Semua timer dihitung dalam tick simulasi (bukan frame render)
+        self.tick_rate = tick_rate  # Tick per detik
+        self.verbose = verbose  # False = tanpa print (simulasi headless)
         self.player = None
         self.monsters = []
         self.current_question = None
@@ -17,36 +26,69 @@ class GameManager:
         self.current_level = 1
         self.monsters_defeated = 0
         self.spawn_timer = 0
+        self.spawn_interval = 3 * tick_rate  # Spawn setiap 3 detik
+        self.max_monsters = 3  # Spawn berhenti kalau monster di layar sudah sebanyak ini
+        self.boss_every = 5  # Boss biasa setiap N monster dikalahkan
         
         # Cooldown untuk mencegah collision berulang dengan monster yang sama
-        self.collision_cooldown = {}  # {monster_id: frame_counter}
-        self.cooldown_duration = 60  # 2 detik di 30 FPS (atau 1 detik di 60 FPS)
+        # Deadline per monster handle, waktu hanya jalan saat PLAYING
+        self.collision_cooldown = CooldownTimer()
+        self.next_monster_handle = 1  # Handle unik, tidak dipakai ulang seperti id()
+        self.cooldown_duration = 1 * tick_rate  # 1 detik
+        
+        # Spatial grid supaya collision hanya cek monster di dekat player
+        self.collision_radius = 50
+        self.monster_grid = SpatialGrid(grid_cell_size)
+        
+        # Opsional: data monster di array NumPy (untuk ribuan monster headless)
+        self.monster_store = MonsterStore() if use_entity_store else None
         
         # BARU: Timer untuk menjawab soal
         self.question_timer = 0
-        self.question_time_limit = 30 * 60  # 30 detik * 60 FPS = 1800 frames
+        self.question_time_limit = 30 * tick_rate  # 30 detik = 1800 tick di 60 tick/detik
         self.question_start_time = 0
 
-        self.max_level = 10  # Level maksimal
         self.final_boss_spawned = False  # Flag final boss
         self.is_final_boss_battle = False  # Flag battle state
+        
+        # RNG per sesi, supaya sesi bisa di-replay persis sama
+        self.seed = None
+        self.rng = random.Random()
+        self.recorder = None  # InputLog (opsional), diisi dari luar
+    
+    @property
+    def max_level(self):
+        """Level maksimal = level final boss (satu sumber: Player.MAX_LEVEL)"""
+        return Player.MAX_LEVEL
     
-    def start_game(self, player_name):
-        """Inisialisasi game baru"""
-        self.player = Player(player_name)
+    def start_game(self, player_name, seed=None):
+        """Inisialisasi game baru (seed=None = seed acak)"""
+        self.seed = seed if seed is not None else random.getrandbits(32)
+        self.rng = random.Random(self.seed)
+        self.player = Player(player_name, verbose=self.verbose)
         self.monsters = []
         self.current_level = 1
         self.monsters_defeated = 0
         self.game_state = "PLAYING"
-        self.collision_cooldown = {}
+        
+        # Reset timer & handle supaya sesi baru tidak tergantung sesi sebelumnya
+        self.spawn_timer = 0
+        self.question_timer = 0
+        self.current_question = None
+        self.current_monster = None
+        self.next_monster_handle = 1
+        self.collision_cooldown.clear()
+        self.monster_grid.clear()
+        if self.monster_store is not None:
+            self.monster_store.clear()
         self.final_boss_spawned = False
         self.is_final_boss_battle = False
         self.spawn_monster()
 
     def spawn_monster(self):
    
-     x = random.randint(600, 750)
-     y = random.randint(50, 550)
+     x = self.rng.randint(600, 750)
+     y = self.rng.randint(50, 550)
     
      player_level = self.player.get_level()
     
@@ -55,10 +97,11 @@ class GameManager:
         monster = Boss(f"FINAL BOSS", self.max_level * 2, x, y)
         self.final_boss_spawned = True
         self.is_final_boss_battle = True
-        print("=== FINAL BOSS APPEARED! ===")
+        if self.verbose:
+            print("=== FINAL BOSS APPEARED! ===")
     
     # Boss biasa setiap 5 monster
-     elif self.monsters_defeated > 0 and self.monsters_defeated % 5 == 0:
+     elif self.monsters_defeated > 0 and self.monsters_defeated % self.boss_every == 0:
         monster = Boss(f"Boss {player_level}", player_level, x, y)
     
     # Monster biasa
@@ -66,7 +109,28 @@ class GameManager:
         difficulty = min(player_level, 3)
         monster = Monster(f"Monster {len(self.monsters)}", difficulty, x, y)
     
-     self.monsters.append(monster)
+     self.add_monster(monster)
+    
+    def add_monster(self, monster, handle=None):
+        """Tambah monster ke list dan ke spatial grid (handle diisi saat load save)"""
+        if handle is None:
+            handle = self.next_monster_handle
+            self.next_monster_handle += 1
+        monster.set_handle(handle)
+        self.monsters.append(monster)
+        if self.monster_store is not None:
+            self.monster_store.add(monster)
+        else:
+            x, y = monster.get_position()
+            self.monster_grid.insert(monster, x, y)
+    
+    def remove_monster(self, monster):
+        if monster in self.monsters:
+            self.monsters.remove(monster)
+        if self.monster_store is not None:
+            self.monster_store.remove(monster)
+        else:
+            self.monster_grid.remove(monster)
     
     def check_collision(self):
         """
@@ -75,32 +139,51 @@ class GameManager:
         """
         player_x, player_y = self.player.get_position()
         
-        for monster in self.monsters:
+        if self.monster_store is not None:
+            # Cek jarak semua monster sekaligus (NumPy)
+            hits = [monster for monster in self.monster_store.find_colliding(player_x, player_y, self.collision_radius)
+                    if not self.collision_cooldown.is_active(monster.get_handle())]
+        else:
+            hits = self.__find_hits_in_grid(player_x, player_y)
+        
+        if not hits:
+            return False
+        
+        # Kalau kena beberapa, ambil yang paling awal di list (sama seperti dulu)
+        monster = hits[0] if len(hits) == 1 else min(hits, key=self.monsters.index)
+        
+        # Trigger question
+        question_text, answer = monster.get_question(self.rng)
+        self.current_question = Question(question_text, answer, self.rng)
+        self.current_monster = monster
+        self.game_state = "QUESTION"
+        
+        # Set cooldown untuk monster ini
+        self.collision_cooldown.start(monster.get_handle(), self.cooldown_duration)
+        
+        # BARU: Start timer untuk menjawab
+        self.question_timer = self.question_time_limit
+        
+        return True
+    
+    def __find_hits_in_grid(self, player_x, player_y):
+        radius_squared = self.collision_radius ** 2
+        hits = []
+        
+        # Hanya monster di cell sekitar player
+        for monster in self.monster_grid.query(player_x, player_y, self.collision_radius):
             # Cek cooldown untuk monster ini
-            monster_id = id(monster)
-            if monster_id in self.collision_cooldown:
-                if self.collision_cooldown[monster_id] > 0:
-                    continue  # Skip monster ini karena masih cooldown
+            if self.collision_cooldown.is_active(monster.get_handle()):
+                continue  # Skip monster ini karena masih cooldown
             
             monster_x, monster_y = monster.get_position()
-            distance = ((player_x - monster_x)**2 + (player_y - monster_y)**2)**0.5
+            # Jarak kuadrat, tidak perlu akar
+            distance_squared = (player_x - monster_x)**2 + (player_y - monster_y)**2
             
-            if distance < 50:  # Collision threshold
-                # Trigger question
-                question_text, answer = monster.get_question()
-                self.current_question = Question(question_text, answer)
-                self.current_monster = monster
-                self.game_state = "QUESTION"
-                
-                # Set cooldown untuk monster ini
-                self.collision_cooldown[monster_id] = self.cooldown_duration
-                
-                # BARU: Start timer untuk menjawab
-                self.question_timer = self.question_time_limit
-                
-                return True
-        
-        return False
+            if distance_squared < radius_squared:  # Collision threshold
+                hits.append(monster)
+        
+        return hits
     
     def answer_question(self, user_answer):
      is_correct = self.current_question.check_answer(user_answer)
@@ -111,29 +194,28 @@ class GameManager:
         self.player.gain_score(reward)
         is_final_boss = False
         if self.is_final_boss_battle:
-            # Check if current monster is a Boss (has special ability)
-            if hasattr(self.current_monster, '_Boss__special_ability'):
+            # Check if current monster is a Boss
+            if self.current_monster.kind == "boss":
                 is_final_boss = True
         
         # Hapus monster dari list dan cooldown
-        monster_id = id(self.current_monster)
-        if monster_id in self.collision_cooldown:
-            del self.collision_cooldown[monster_id]
+        self.collision_cooldown.cancel(self.current_monster.get_handle())
         
         # Remove monster dari list
-        if self.current_monster in self.monsters:
-            self.monsters.remove(self.current_monster)
+        self.remove_monster(self.current_monster)
         
         self.monsters_defeated += 1
         
         if is_final_boss:
-            print("DEBUG: Setting state to WIN!")
+            if self.verbose:
+                print("DEBUG: Setting state to WIN!")
             self.game_state = "WIN"  # WIN!
             self.current_question = None
             self.current_monster = None
             self.question_timer = 0
-            print("=== YOU DEFEATED THE FINAL BOSS! ===")
-            print(f"DEBUG: Game state is now: {self.game_state}")
+            if self.verbose:
+                print("=== YOU DEFEATED THE FINAL BOSS! ===")
+                print(f"DEBUG: Game state is now: {self.game_state}")
             return
         
         
@@ -143,8 +225,7 @@ class GameManager:
         self.player.take_damage(damage)
         
         # Monster tidak mati, set cooldown
-        monster_id = id(self.current_monster)
-        self.collision_cooldown[monster_id] = self.cooldown_duration
+        self.collision_cooldown.start(self.current_monster.get_handle(), self.cooldown_duration)
         
         # Cek apakah player mati
         if not self.player.is_alive():
@@ -162,6 +243,25 @@ class GameManager:
      self.question_timer = 0
      self.game_state = "PLAYING"
     
+    def choose_option(self, index):
+        """Jawab soal dengan nomor pilihan (0-3), sama seperti tombol 1-4"""
+        if self.game_state != "QUESTION":
+            return
+        options = self.current_question.get_options()
+        if 0 <= index < len(options):
+            self.answer_question(options[index])
+    
+    def move_player(self, keys):
+        """Gerakkan player (keys = [UP, DOWN, LEFT, RIGHT]) dan jaga tetap di layar"""
+        if self.game_state != "PLAYING":
+            return
+        self.player.move_with_keys(keys)
+        
+        # Keep player in bounds
+        x, y = self.player.get_position()
+        self.player._x = max(20, min(self.screen_width - 20, x))
+        self.player._y = max(20, min(self.screen_height - 20, y))
+    
     def timeout_question(self):
         if self.current_monster is None:
             return
@@ -171,8 +271,7 @@ class GameManager:
         self.player.take_damage(damage)
         
         # Monster tidak mati, set cooldown
-        monster_id = id(self.current_monster)
-        self.collision_cooldown[monster_id] = self.cooldown_duration
+        self.collision_cooldown.start(self.current_monster.get_handle(), self.cooldown_duration)
         
         # Cek apakah player mati
         if not self.player.is_alive():
@@ -192,25 +291,28 @@ class GameManager:
     
     def update(self):
         if self.game_state == "PLAYING":
-            # Update cooldown timers
-            for monster_id in list(self.collision_cooldown.keys()):
-                self.collision_cooldown[monster_id] -= 1
-                if self.collision_cooldown[monster_id] <= 0:
-                    del self.collision_cooldown[monster_id]
+            # Update cooldown timers (hanya yang habis yang diproses)
+            self.collision_cooldown.tick()
             
             # Update monster AI
             player_x, player_y = self.player.get_position()
             
-            for monster in self.monsters:
-                if monster.is_alive():
-                    monster.move_towards_player(player_x, player_y)
+            if self.monster_store is not None:
+                # Semua monster bergerak dalam satu operasi array
+                self.monster_store.move_towards(player_x, player_y)
+            else:
+                for monster in self.monsters:
+                    if monster.is_alive():
+                        monster.move_towards_player(player_x, player_y)
+                        monster_x, monster_y = monster.get_position()
+                        self.monster_grid.move(monster, monster_x, monster_y)
             
             # Check collision
             self.check_collision()
             
             # Spawn monster baru
             self.spawn_timer += 1
-            if self.spawn_timer > 180 and len(self.monsters) < 3:  # Setiap 3 detik
+            if self.spawn_timer > self.spawn_interval and len(self.monsters) < self.max_monsters:  # Setiap 3 detik
                 self.spawn_monster()
                 self.spawn_timer = 0
         
@@ -222,6 +324,39 @@ class GameManager:
             if self.question_timer <= 0:
                 self.timeout_question()
     
+    def step(self, n_frames=1, inputs=None):
+        """
+        Jalankan simulasi sebanyak n_frames tanpa display (headless)
+        inputs: list per frame berisi (keys, answer_index) atau None,
+                answer_index = None kalau tidak menjawab di frame itu
+        """
+        for frame in range(n_frames):
+            keys, answer_index = None, None
+            if inputs is not None and frame < len(inputs) and inputs[frame] is not None:
+                keys, answer_index = inputs[frame]
+            
+            self.step_frame(keys, answer_index)
+            
+            if self.game_state in ("GAME_OVER", "WIN", "MENU"):
+                break
+        
+        return self.game_state
+    
+    def step_frame(self, keys=None, answer_index=None):
+        """
+        Satu frame simulasi: jawab soal, gerakkan player, lalu update
+        Dipakai main.py dan simulasi headless supaya urutannya selalu sama
+        """
+        if self.recorder is not None:
+            self.recorder.record(keys, answer_index)
+        
+        if answer_index is not None:
+            self.choose_option(answer_index)
+        if keys is not None:
+            self.move_player(keys)
+        
+        self.update()
+    
     def get_game_stats(self):
         """Return statistik game untuk ditampilkan"""
         return {
@@ -233,7 +368,19 @@ class GameManager:
             'current_wave': self.current_level
         }
     
+    def checksum(self):
+        """CRC32 dari state penting, untuk memastikan replay hasilnya sama persis"""
+        state = [self.game_state, self.monsters_defeated, self.spawn_timer, self.question_timer]
+        if self.player is not None:
+            state += [self.player.get_position(), self.player.get_health(), self.player.get_score(),
+                      self.player.get_level(), self.player.get_lives()]
+        for monster in self.monsters:
+            state += [monster.get_handle(), monster.get_position(), monster.get_difficulty()]
+        if self.current_question is not None:
+            state += [self.current_question.get_question_text(), self.current_question.get_options()]
+        return zlib.crc32(repr(state).encode("utf-8"))
+    
     def get_remaining_time(self):
         if self.game_state == "QUESTION":
-            return max(0, self.question_timer // 60)  # Convert frames ke detik
+            return max(0, self.question_timer // self.tick_rate)  # Convert tick ke detik
         return 0
\ No newline at end of file
@@ -0,0 +1,76 @@
+# classes/game_snapshot.py
+# Salinan state GameManager yang tidak bisa diubah (immutable), untuk dibaca renderer dari thread lain
+# Method-nya sama dengan yang dipakai fungsi draw_* (get_position, get_options, get_game_stats, ...)
+from collections import namedtuple
+
+
+class PlayerSnapshot(namedtuple("PlayerSnapshot", "x y level")):
+    __slots__ = ()
+
+    def get_position(self):
+        return (self.x, self.y)
+
+    def get_level(self):
+        return self.level
+
+
+class MonsterSnapshot(namedtuple("MonsterSnapshot", "handle kind x y difficulty")):
+    __slots__ = ()
+
+    def get_handle(self):
+        return self.handle
+
+    def get_position(self):
+        return (self.x, self.y)
+
+    def get_difficulty(self):
+        return self.difficulty
+
+
+class QuestionSnapshot(namedtuple("QuestionSnapshot", "text options")):
+    __slots__ = ()
+
+    def get_question_text(self):
+        return self.text
+
+    def get_options(self):
+        return list(self.options)
+
+
+class GameSnapshot(namedtuple("GameSnapshot",
+                              "tick time game_state player monsters current_question stats remaining_time max_level")):
+    __slots__ = ()
+
+    def get_game_stats(self):
+        return dict(self.stats)
+
+    def get_remaining_time(self):
+        return self.remaining_time
+
+    def get_positions(self):
+        """{'player' / handle monster: (x, y)} untuk interpolasi"""
+        positions = {monster.handle: (monster.x, monster.y) for monster in self.monsters}
+        if self.player is not None:
+            positions['player'] = (self.player.x, self.player.y)
+        return positions
+
+
+def capture(game_manager, tick, time):
+    """Buat GameSnapshot dari GameManager (dipanggil di thread simulasi)"""
+    player = game_manager.player
+    if player is not None:
+        x, y = player.get_position()
+        player = PlayerSnapshot(x, y, player.get_level())
+
+    monsters = []
+    for monster in game_manager.monsters:
+        x, y = monster.get_position()
+        monsters.append(MonsterSnapshot(monster.get_handle(), monster.kind, x, y, monster.get_difficulty()))
+
+    question = game_manager.current_question
+    if question is not None:
+        question = QuestionSnapshot(question.get_question_text(), tuple(question.get_options()))
+
+    stats = tuple(game_manager.get_game_stats().items()) if game_manager.player is not None else ()
+    return GameSnapshot(tick, time, game_manager.game_state, player, tuple(monsters), question, stats,
+                        game_manager.get_remaining_time(), game_manager.max_level)
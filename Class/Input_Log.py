@@ -0,0 +1,129 @@
+# classes/input_log.py
+import struct
+
+from Class.Game_Manager import GameManager
+
+# Bit untuk tombol gerak, urutan sama dengan Player.move_with_keys
+KEY_UP = 1
+KEY_DOWN = 2
+KEY_LEFT = 4
+KEY_RIGHT = 8
+ANSWER_SHIFT = 4  # Bit 4-6: 0 = tidak menjawab, 1-4 = pilihan 1-4
+
+MAGIC = b"MALG"
+VERSION = 2
+_HEADER = struct.Struct("<4sBQHHHB")  # magic, versi, seed, width, height, tick rate, panjang nama
+_FOOTER = struct.Struct("<IIB")  # jumlah frame, checksum, ada checksum?
+_RUN = struct.Struct("<BH")  # nilai frame, diulang berapa kali
+
+
+def encode_frame(keys, answer_index):
+    """Ubah input satu frame jadi 1 byte"""
+    value = 0
+    if keys is not None:
+        for bit, pressed in zip((KEY_UP, KEY_DOWN, KEY_LEFT, KEY_RIGHT), keys):
+            if pressed:
+                value |= bit
+    if answer_index is not None:
+        value |= (answer_index + 1) << ANSWER_SHIFT
+    return value
+
+
+def decode_frame(value):
+    keys = [bool(value & bit) for bit in (KEY_UP, KEY_DOWN, KEY_LEFT, KEY_RIGHT)]
+    answer = value >> ANSWER_SHIFT
+    return keys, (answer - 1 if answer else None)
+
+
+class InputLog:
+    """
+    Class untuk merekam input per frame (bitmask tombol + pilihan jawaban)
+    Disimpan dalam format biner kecil (run-length), bisa di-replay dengan replay()
+    """
+
+    def __init__(self, seed, player_name="Player", screen_width=800, screen_height=600, tick_rate=60):
+        self.seed = seed
+        self.player_name = player_name
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.tick_rate = tick_rate  # Timer simulasi dihitung dalam tick, replay harus pakai rate yang sama
+        self.checksum = None  # Checksum state terakhir, untuk cek replay
+        self.__runs = []  # [[nilai, jumlah_frame]]
+        self.__frame_count = 0
+
+    def record(self, keys, answer_index):
+        value = encode_frame(keys, answer_index)
+        if self.__runs and self.__runs[-1][0] == value and self.__runs[-1][1] < 0xFFFF:
+            self.__runs[-1][1] += 1
+        else:
+            self.__runs.append([value, 1])
+        self.__frame_count += 1
+
+    def frames(self):
+        """Generator (keys, answer_index) untuk setiap frame"""
+        for value, count in self.__runs:
+            frame_input = decode_frame(value)
+            for _ in range(count):
+                yield frame_input
+
+    def __len__(self):
+        return self.__frame_count
+
+    def to_bytes(self):
+        name = self.player_name.encode("utf-8")[:255]
+        parts = [_HEADER.pack(MAGIC, VERSION, self.seed, self.screen_width, self.screen_height,
+                              self.tick_rate, len(name)), name]
+        parts.append(struct.pack("<I", len(self.__runs)))
+        parts.extend(_RUN.pack(value, count) for value, count in self.__runs)
+        parts.append(_FOOTER.pack(self.__frame_count, self.checksum or 0, self.checksum is not None))
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, seed, width, height, tick_rate, name_length = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Bukan file input log Math Adventure (atau versi berbeda)")
+
+        offset = _HEADER.size
+        name = data[offset:offset + name_length].decode("utf-8")
+        offset += name_length
+
+        log = cls(seed, name, width, height, tick_rate)
+        (run_count,) = struct.unpack_from("<I", data, offset)
+        offset += 4
+        for _ in range(run_count):
+            value, count = _RUN.unpack_from(data, offset)
+            offset += _RUN.size
+            log.__runs.append([value, count])
+            log.__frame_count += count
+
+        frame_count, checksum, has_checksum = _FOOTER.unpack_from(data, offset)
+        if frame_count != log.__frame_count:
+            raise ValueError("Input log rusak (jumlah frame tidak cocok)")
+        log.checksum = checksum if has_checksum else None
+        return log
+
+    def save(self, path):
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+
+def replay(log, **game_manager_options):
+    """
+    Jalankan ulang sesi dari input log secepat mungkin (tanpa render)
+    Return GameManager di akhir sesi
+    """
+    game_manager_options.setdefault("verbose", False)
+    tick_rate = game_manager_options.setdefault("tick_rate", log.tick_rate)
+    if tick_rate != log.tick_rate:
+        raise ValueError(f"Input log direkam dengan tick rate {log.tick_rate}, bukan {tick_rate}")
+    game_manager = GameManager(log.screen_width, log.screen_height, **game_manager_options)
+    game_manager.start_game(log.player_name, seed=log.seed)
+    for keys, answer_index in log.frames():
+        game_manager.step_frame(keys, answer_index)
+    return game_manager
@@ -6,13 +6,30 @@ class Monster(Character):
     """
     Class Monster mewarisi Character (Inheritance)
     """
+    __slots__ = ("__difficulty", "__reward_points", "__speed", "__handle", "_store", "_slot")
+    kind = "monster"  # Jenis monster, dipakai untuk cek Boss dan memilih gambar
+    
+    # Konstanta balancing (bisa diubah per proses oleh Tools/balance_sweep.py)
+    BASE_HEALTH = 30
+    HEALTH_PER_DIFFICULTY = 20
+    REWARD_PER_DIFFICULTY = 10
+    BASE_SPEED = 2
+    BASE_DAMAGE = 10
+    DAMAGE_PER_DIFFICULTY = 5
     
     def __init__(self, name, difficulty, x, y):
-        health = 30 + (difficulty * 20)
+        health = self.BASE_HEALTH + (difficulty * self.HEALTH_PER_DIFFICULTY)
         super().__init__(name, health, x, y)
         self.__difficulty = difficulty  # Private (Encapsulation)
-        self.__reward_points = 10 * difficulty
-        self.__speed = 2 + difficulty
+        self.__reward_points = self.REWARD_PER_DIFFICULTY * difficulty
+        self.__speed = self.BASE_SPEED + difficulty
+        
+        # Handle unik dari GameManager (dipakai untuk cooldown)
+        self.__handle = None
+        
+        # Kalau disimpan di MonsterStore, data posisi/health ada di array
+        self._store = None
+        self._slot = None
     
     def get_difficulty(self):
         return self.__difficulty
@@ -20,12 +37,79 @@ class Monster(Character):
     def get_reward_points(self):
         return self.__reward_points
     
+    def get_speed(self):
+        return self.__speed
+    
+    def get_handle(self):
+        return self.__handle
+    
+    def set_handle(self, handle):
+        self.__handle = handle
+    
+    # ===== View ke MonsterStore =====
+    def attach_store(self, store, slot):
+        self._store = store
+        self._slot = slot
+    
+    def detach_store(self):
+        """Salin data dari array kembali ke object"""
+        if self._store is None:
+            return
+        x, y = self.get_position()
+        health = self.get_health()
+        alive = self.is_alive()
+        self._store = None
+        self._slot = None
+        self._x, self._y = x, y
+        super().set_health(health)
+        self._is_alive = alive
+    
+    def get_slot(self):
+        return self._slot
+    
+    def get_position(self):
+        if self._store is None:
+            return super().get_position()
+        return (int(self._store.x[self._slot]), int(self._store.y[self._slot]))
+    
+    def move(self, dx, dy):
+        if self._store is None:
+            return super().move(dx, dy)
+        self._store.x[self._slot] += dx
+        self._store.y[self._slot] += dy
+    
+    def get_health(self):
+        if self._store is None:
+            return super().get_health()
+        return int(self._store.health[self._slot])
+    
+    def set_health(self, value):
+        if self._store is None:
+            return super().set_health(value)
+        self._store.health[self._slot] = max(0, value)
+        if value <= 0:
+            self._store.alive[self._slot] = False
+    
+    def take_damage(self, damage):
+        self.set_health(self.get_health() - damage)
+    
+    def is_alive(self):
+        if self._store is None:
+            return super().is_alive()
+        return bool(self._store.alive[self._slot])
+    
     def attack(self):
         """Override method attack (Polymorphism)"""
-        return 10 + (self.__difficulty * 5)
+        return self.BASE_DAMAGE + (self.__difficulty * self.DAMAGE_PER_DIFFICULTY)
     
     def move_towards_player(self, player_x, player_y):
         """AI sederhana untuk mengejar player"""
+        if self._store is not None:
+            x, y = self.get_position()
+            self.move(self.__speed * ((x < player_x) - (x > player_x)),
+                      self.__speed * ((y < player_y) - (y > player_y)))
+            return
+        
         if self._x < player_x:
             self._x += self.__speed
         elif self._x > player_x:
@@ -36,24 +120,24 @@ class Monster(Character):
         elif self._y > player_y:
             self._y -= self.__speed
     
-    def get_question(self):
-        """Generate soal berdasarkan difficulty"""
+    def get_question(self, rng=random):
+        """Generate soal berdasarkan difficulty (rng = random.Random milik GameManager)"""
         if self.__difficulty == 1:
             # Penjumlahan sederhana
-            a = random.randint(1, 20)
-            b = random.randint(1, 20)
+            a = rng.randint(1, 20)
+            b = rng.randint(1, 20)
             question = f"{a} + {b} = ?"
             answer = a + b
         elif self.__difficulty == 2:
             # Pengurangan dan perkalian
-            a = random.randint(1, 12)
-            b = random.randint(1, 12)
+            a = rng.randint(1, 12)
+            b = rng.randint(1, 12)
             question = f"{a} × {b} = ?"
             answer = a * b
         else:
             # Pembagian
-            b = random.randint(2, 10)
-            answer = random.randint(2, 15)
+            b = rng.randint(2, 10)
+            answer = rng.randint(2, 15)
             a = answer * b
             question = f"{a} ÷ {b} = ?"
         
@@ -65,16 +149,20 @@ class Boss(Monster):
     Class Boss mewarisi Monster (Multi-level Inheritance)
     Mendemonstrasikan Polymorphism dengan special ability
     """
+    __slots__ = ("__special_ability", "__special_cooldown")
+    kind = "boss"
+    DIFFICULTY_BONUS = 2
+    ATTACK_MULTIPLIER = 2
     
     def __init__(self, name, difficulty, x, y):
-        super().__init__(name, difficulty + 2, x, y)
+        super().__init__(name, difficulty + self.DIFFICULTY_BONUS, x, y)
         self.__special_ability = "Multi-Question"
         self.__special_cooldown = 0
     
     def attack(self):
         """Override attack dengan damage lebih besar (Polymorphism)"""
         base_damage = super().attack()
-        return base_damage * 2
+        return base_damage * self.ATTACK_MULTIPLIER
     
     def special_attack(self):
         """Method khusus Boss"""
@@ -87,12 +175,18 @@ class Boss(Monster):
         if self.__special_cooldown > 0:
             self.__special_cooldown -= 1
     
-    def get_question(self):
+    def get_special_cooldown(self):
+        return self.__special_cooldown
+    
+    def set_special_cooldown(self, value):
+        self.__special_cooldown = value
+    
+    def get_question(self, rng=random):
         """Override untuk soal lebih sulit (Polymorphism)"""
         # Soal kombinasi operasi
-        a = random.randint(5, 20)
-        b = random.randint(2, 10)
-        c = random.randint(1, 10)
+        a = rng.randint(5, 20)
+        b = rng.randint(2, 10)
+        c = rng.randint(1, 10)
         
         operations = [
             (f"({a} + {b}) × {c} = ?", (a + b) * c),
@@ -100,5 +194,5 @@ class Boss(Monster):
             (f"({a} - {b}) × {c} = ?", (a - b) * c)
         ]
         
-        question, answer = random.choice(operations)
+        question, answer = rng.choice(operations)
         return question, answer
\ No newline at end of file
@@ -3,8 +3,16 @@ from Class.Character import Character
 
 
 class Player(Character):
-    def __init__(self, name, x=100, y=400):
+    __slots__ = ("verbose", "__score", "__level", "__lives", "__speed")
+    
+    # Konstanta balancing (bisa diubah per proses oleh Tools/balance_sweep.py)
+    SCORE_PER_LEVEL = 100
+    LEVEL_UP_HEALTH = 20
+    MAX_LEVEL = 10
+    
+    def __init__(self, name, x=100, y=400, verbose=True):
         super().__init__(name, health=100, x=x, y=y)
+        self.verbose = verbose
         self.__score = 0  # Private attribute
         self.__level = 1
         self.__lives = 3
@@ -23,6 +31,12 @@ class Player(Character):
     def get_speed(self):
         return self.__speed
     
+    def restore_progress(self, score, level, lives):
+        """Set score, level dan nyawa langsung (dipakai saat load save)"""
+        self.__score = score
+        self.__level = level
+        self.__lives = lives
+    
     # Methods
     def answer_question(self, is_correct):
         """Method untuk memproses jawaban"""
@@ -37,19 +51,20 @@ class Player(Character):
         """Method untuk menambah score"""
         self.__score += points
         # Level up setiap 100 points
-        if self.__score >= self.__level * 100:
+        if self.__score >= self.__level * self.SCORE_PER_LEVEL:
             self.level_up()
     
     def level_up(self):
    
-     if self.__level >= 10:
+     if self.__level >= self.MAX_LEVEL:
         return  # Stop di level 10
     
      self.__level += 1
-     bonus_health = 20
+     bonus_health = self.LEVEL_UP_HEALTH
      new_health = self.get_health() + bonus_health
      self.set_health(new_health)
-     print(f"Level Up! Now level {self.__level}")
+     if self.verbose:
+        print(f"Level Up! Now level {self.__level}")
     
     def lose_life(self):
         """Method untuk kehilangan nyawa"""
@@ -1,5 +1,12 @@
 # classes/question.py
+import ast
+import operator
 import random
+import re
+from functools import lru_cache
+
+# Operasi yang boleh muncul di soal (tanpa eval)
+_BINARY_OPERATORS = {ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul, ast.Div: operator.truediv}
 
 class Question:
     """
@@ -7,24 +14,58 @@ class Question:
     Mendemonstrasikan Encapsulation
     """
     
-    def __init__(self, question_text, correct_answer):
+    def __init__(self, question_text, correct_answer, rng=random, options=None):
         self.__question_text = question_text  # Private
         self.__correct_answer = correct_answer  # Private
-        self.__options = self.__generate_options()
+        self.__rng = rng  # random.Random milik GameManager (supaya bisa di-replay)
+        # options diisi saat load save, supaya pilihan sama dan rng tidak dipakai
+        self.__options = list(options) if options is not None else self.__generate_options()
     
     def __generate_options(self):
-        """Private method untuk generate pilihan jawaban"""
-        options = [self.__correct_answer]
+        """
+        Private method untuk generate pilihan jawaban
+        Selalu selesai dalam jumlah langkah tetap (tidak ada loop acak tanpa batas)
+        """
+        answer = self.__correct_answer
+        
+        # Jawaban salah yang "masuk akal" (kesalahan yang sering dibuat siswa)
+        plausible = self.__plausible_wrong_answers()
+        self.__rng.shuffle(plausible)
         
-        # Generate 3 jawaban salah
-        while len(options) < 4:
-            wrong = self.__correct_answer + random.randint(-10, 10)
-            if wrong not in options and wrong > 0:
-                options.append(wrong)
+        # Cadangan: angka di sekitar jawaban, lalu answer+1..3 yang pasti valid
+        nearby = [answer + self.__rng.choice((-1, 1)) * offset for offset in self.__rng.sample(range(2, 11), 4)]
+        fallback = [answer + 1, answer + 2, answer + 3]
         
-        random.shuffle(options)
+        wrong = []
+        for value in plausible + nearby + fallback:
+            # Kalau jawaban positif, pilihan salah juga positif (seperti dulu)
+            if value == answer or value in wrong or (answer > 0 and value <= 0):
+                continue
+            wrong.append(value)
+            if len(wrong) == 3:
+                break
+        
+        options = [answer] + wrong
+        self.__rng.shuffle(options)
         return options
     
+    def __plausible_wrong_answers(self):
+        answer = self.__correct_answer
+        candidates = [answer + 1, answer - 1, answer + 10, answer - 10]  # Off-by-one / off-by-ten
+        
+        # Digit tertukar: 42 -> 24
+        digits = str(abs(answer))
+        if len(digits) > 1:
+            swapped = int(digits[::-1])
+            candidates.append(-swapped if answer < 0 else swapped)
+        
+        # Salah tanda (untuk jawaban negatif)
+        if answer < 0:
+            candidates.append(-answer)
+        
+        candidates.extend(_operation_swaps(self.__question_text))
+        return candidates
+    
     def get_question_text(self):
         return self.__question_text
     
@@ -36,4 +77,42 @@ class Question:
         return user_answer == self.__correct_answer
     
     def get_correct_answer(self):
-        return self.__correct_answer
\ No newline at end of file
+        return self.__correct_answer
+
+
+@lru_cache(maxsize=4096)
+def _operation_swaps(question_text):
+    """Hitung ulang soal dengan satu operasi ditukar, mis. 3 × 4 -> 3 + 4"""
+    expression = question_text.split("=")[0]
+    expression = expression.replace("×", "*").replace("÷", "/")
+    
+    # Hanya angka, spasi, kurung dan + - * / yang boleh dihitung
+    if not re.fullmatch(r"[\d\s()+\-*/]+", expression):
+        return ()
+    
+    results = []
+    positions = [i for i, char in enumerate(expression) if char in "+-*/"]
+    for position in positions:
+        for symbol in "+-*":
+            if symbol == expression[position]:
+                continue
+            swapped = expression[:position] + symbol + expression[position + 1:]
+            try:
+                value = _calculate(ast.parse(swapped.strip(), mode="eval").body)
+            except (SyntaxError, ValueError, ZeroDivisionError):
+                continue
+            if value == int(value):
+                results.append(int(value))
+    return tuple(results)
+
+
+def _calculate(node):
+    """Hitung expression hasil ast.parse: hanya angka, + - * / dan tanda minus"""
+    if isinstance(node, ast.Constant) and isinstance(node.value, int):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+        return _BINARY_OPERATORS[type(node.op)](_calculate(node.left), _calculate(node.right))
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        value = _calculate(node.operand)
+        return -value if isinstance(node.op, ast.USub) else value
+    raise ValueError("Bukan expression soal")
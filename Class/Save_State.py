@@ -0,0 +1,304 @@
+# classes/save_state.py
+# Save / resume GameManager dalam format biner kecil
+# File = header (magic + versi) + record. Setiap record berisi section yang berubah saja,
+# record pertama selalu berisi semua section (dipakai AutoSave untuk save incremental)
+import os
+import random
+import struct
+import zlib
+
+from Class.Monster import Monster, Boss
+from Class.Player import Player
+from Class.Question import Question
+
+MAGIC = b"MASS"
+VERSION = 1
+
+STATES = ("MENU", "PLAYING", "QUESTION", "GAME_OVER", "WIN")
+KINDS = ("monster", "boss")
+
+# Bit section di record (urutan bit = urutan restore)
+SECTION_CORE = 1  # State, timer, counter, flag final boss
+SECTION_PLAYER = 2
+SECTION_MONSTERS = 4
+SECTION_COOLDOWNS = 8
+SECTION_QUESTION = 16
+SECTION_RNG = 32
+ALL_SECTIONS = 63
+
+_HEADER = struct.Struct("<4sB")  # magic, versi
+_RECORD = struct.Struct("<IIB")  # panjang isi, crc32 isi, bit section
+_SECTION = struct.Struct("<I")  # panjang section
+_CORE = struct.Struct("<BQHIIiIBBI")  # state, seed, level, defeated, spawn timer, question timer,
+                                      # handle berikutnya, final boss spawned, final battle, handle current monster
+_PLAYER = struct.Struct("<iiiIBBB")  # health, x, y, score, level, lives, alive
+_MONSTER = struct.Struct("<BIBiiiBB")  # kind, handle, difficulty, x, y, health, special cooldown, panjang nama
+_COOLDOWN = struct.Struct("<II")  # handle, sisa tick
+_RNG = struct.Struct("<625IBd")  # state Mersenne Twister, ada gauss_next?, gauss_next
+
+
+# ===== Encode =====
+def encode_sections(game_manager):
+    """Return {bit section: bytes} dari state GameManager sekarang"""
+    player = game_manager.player
+    if player is None:
+        raise ValueError("Belum ada game yang bisa disimpan")
+    current = game_manager.current_monster
+    sections = {
+        SECTION_CORE: _CORE.pack(STATES.index(game_manager.game_state), game_manager.seed or 0,
+                                 game_manager.current_level, game_manager.monsters_defeated,
+                                 game_manager.spawn_timer, game_manager.question_timer,
+                                 game_manager.next_monster_handle, game_manager.final_boss_spawned,
+                                 game_manager.is_final_boss_battle, 0 if current is None else current.get_handle()),
+        SECTION_PLAYER: _pack_name(player._name) + _PLAYER.pack(
+            player.get_health(), *player.get_position(), player.get_score(), player.get_level(),
+            player.get_lives(), player.is_alive()),
+        SECTION_MONSTERS: _encode_monsters(game_manager.monsters),
+        SECTION_COOLDOWNS: _encode_cooldowns(game_manager.collision_cooldown),
+        SECTION_QUESTION: _encode_question(game_manager.current_question),
+        SECTION_RNG: _encode_rng(game_manager.rng),
+    }
+    return sections
+
+
+def _pack_name(name):
+    data = name.encode("utf-8")[:255]
+    return bytes((len(data),)) + data
+
+
+def _encode_monsters(monsters):
+    parts = [struct.pack("<I", len(monsters))]
+    for monster in monsters:
+        name = monster._name.encode("utf-8")[:255]
+        x, y = monster.get_position()
+        special = monster.get_special_cooldown() if monster.kind == "boss" else 0
+        parts.append(_MONSTER.pack(KINDS.index(monster.kind), monster.get_handle(), monster.get_difficulty(),
+                                   x, y, monster.get_health(), special, len(name)))
+        parts.append(name)
+    return b"".join(parts)
+
+
+def _encode_cooldowns(cooldown):
+    items = cooldown.items()
+    return (struct.pack("<II", cooldown.now, len(items))
+            + b"".join(_COOLDOWN.pack(handle, remaining) for handle, remaining in items))
+
+
+def _encode_question(question):
+    if question is None:
+        return b""  # Kosong = tidak ada soal
+    options = question.get_options()
+    return (_pack_name(question.get_question_text())
+            + struct.pack(f"<iB{len(options)}i", question.get_correct_answer(), len(options), *options))
+
+
+def _encode_rng(rng):
+    _, internal, gauss_next = rng.getstate()
+    return _RNG.pack(*internal, gauss_next is not None, gauss_next or 0.0)
+
+
+def pack_record(sections):
+    """Satu record dari {bit section: bytes} (bisa sebagian section saja)"""
+    mask = 0
+    parts = []
+    for bit in sorted(sections):
+        mask |= bit
+        parts.append(_SECTION.pack(len(sections[bit])))
+        parts.append(sections[bit])
+    body = b"".join(parts)
+    return _RECORD.pack(len(body), zlib.crc32(body), mask) + body
+
+
+def snapshot(game_manager):
+    """Return bytes save lengkap (header + satu record dengan semua section)"""
+    return _HEADER.pack(MAGIC, VERSION) + pack_record(encode_sections(game_manager))
+
+
+# ===== Decode =====
+def read_sections(data):
+    """
+    Gabungkan semua record di data jadi {bit section: bytes} (record terakhir menang)
+    Record terakhir yang terpotong / rusak (crash saat menulis) diabaikan
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("File save kosong atau terpotong")
+    magic, version = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Bukan file save Math Adventure (atau versi berbeda)")
+
+    sections = {}
+    offset = _HEADER.size
+    while offset + _RECORD.size <= len(data):
+        length, checksum, mask = _RECORD.unpack_from(data, offset)
+        body = data[offset + _RECORD.size:offset + _RECORD.size + length]
+        if len(body) != length or zlib.crc32(body) != checksum:
+            break
+        position = 0
+        for bit in (1 << i for i in range(mask.bit_length())):
+            if not mask & bit:
+                continue
+            (size,) = _SECTION.unpack_from(body, position)
+            position += _SECTION.size
+            sections[bit] = body[position:position + size]
+            position += size
+        offset += _RECORD.size + length
+
+    if set(sections) != {1 << i for i in range(ALL_SECTIONS.bit_length())}:
+        raise ValueError("File save tidak lengkap")
+    return sections
+
+
+def restore(game_manager, data):
+    """Isi GameManager dari bytes save (snapshot() atau file AutoSave). Return game_manager"""
+    sections = read_sections(data)
+    (state, seed, level, defeated, spawn_timer, question_timer, next_handle, final_boss_spawned,
+     final_battle, current_handle) = _CORE.unpack(sections[SECTION_CORE])
+
+    game_manager.player = _decode_player(sections[SECTION_PLAYER], game_manager.verbose)
+    _decode_monsters(sections[SECTION_MONSTERS], game_manager)
+    _decode_cooldowns(sections[SECTION_COOLDOWNS], game_manager.collision_cooldown)
+    game_manager.current_question = _decode_question(sections[SECTION_QUESTION])
+    game_manager.rng = _decode_rng(sections[SECTION_RNG])
+
+    game_manager.game_state = STATES[state]
+    game_manager.seed = seed
+    game_manager.current_level = level
+    game_manager.monsters_defeated = defeated
+    game_manager.spawn_timer = spawn_timer
+    game_manager.question_timer = question_timer
+    game_manager.next_monster_handle = next_handle
+    game_manager.final_boss_spawned = bool(final_boss_spawned)
+    game_manager.is_final_boss_battle = bool(final_battle)
+    game_manager.current_monster = next((monster for monster in game_manager.monsters
+                                         if monster.get_handle() == current_handle), None)
+    return game_manager
+
+
+def _unpack_name(data, offset):
+    length = data[offset]
+    return data[offset + 1:offset + 1 + length].decode("utf-8"), offset + 1 + length
+
+
+def _decode_player(data, verbose):
+    name, offset = _unpack_name(data, 0)
+    health, x, y, score, level, lives, alive = _PLAYER.unpack_from(data, offset)
+    player = Player(name, x, y, verbose=verbose)
+    player.set_health(health)
+    player.restore_progress(score, level, lives)
+    player._is_alive = bool(alive)
+    return player
+
+
+def _decode_monsters(data, game_manager):
+    game_manager.monsters = []
+    game_manager.monster_grid.clear()
+    if game_manager.monster_store is not None:
+        game_manager.monster_store.clear()
+
+    (count,) = struct.unpack_from("<I", data, 0)
+    offset = 4
+    for _ in range(count):
+        kind, handle, difficulty, x, y, health, special, name_length = _MONSTER.unpack_from(data, offset)
+        offset += _MONSTER.size
+        name = data[offset:offset + name_length].decode("utf-8")
+        offset += name_length
+        if KINDS[kind] == "boss":
+            # Constructor Boss menambah DIFFICULTY_BONUS, yang disimpan difficulty akhir
+            monster = Boss(name, difficulty - Boss.DIFFICULTY_BONUS, x, y)
+            monster.set_special_cooldown(special)
+        else:
+            monster = Monster(name, difficulty, x, y)
+        game_manager.add_monster(monster, handle)
+        monster.set_health(health)
+
+
+def _decode_cooldowns(data, cooldown):
+    now, count = struct.unpack_from("<II", data, 0)
+    cooldown.clear()
+    cooldown.now = now
+    for handle, remaining in _COOLDOWN.iter_unpack(data[8:8 + count * _COOLDOWN.size]):
+        cooldown.start(handle, remaining)
+
+
+def _decode_question(data):
+    if not data:
+        return None
+    text, offset = _unpack_name(data, 0)
+    answer, count = struct.unpack_from("<iB", data, offset)
+    options = struct.unpack_from(f"<{count}i", data, offset + 5)
+    return Question(text, answer, options=options)
+
+
+def _decode_rng(data):
+    values = _RNG.unpack(data)
+    rng = random.Random()
+    rng.setstate((3, values[:625], values[626] if values[625] else None))
+    return rng
+
+
+# ===== Autosave =====
+class AutoSave:
+    """
+    Class autosave incremental ke satu file
+    Save pertama (dan setiap compact_every record) = file penuh, ditulis atomic lewat file .tmp
+    Setelah itu hanya section yang berubah yang di-append (RNG, soal, dst. jarang berubah)
+    """
+
+    def __init__(self, path, every=60, compact_every=300):
+        self.path = path
+        self.every = every  # Save setiap N panggilan tick()
+        self.compact_every = compact_every
+        self.bytes_written = 0
+        self.__written = None  # {bit section: bytes} yang sudah ada di file
+        self.__records = 0
+        self.__ticks = 0
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def tick(self, game_manager):
+        """Panggil setiap tick simulasi (di batas frame). Return jumlah byte yang ditulis"""
+        self.__ticks += 1
+        if self.__ticks < self.every:
+            return 0
+        self.__ticks = 0
+        return self.save(game_manager)
+
+    def save(self, game_manager):
+        sections = encode_sections(game_manager)
+        if self.__written is None or self.__records >= self.compact_every:
+            data = _HEADER.pack(MAGIC, VERSION) + pack_record(sections)
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = self.path + ".tmp"
+            with open(temp_path, "wb") as file:
+                file.write(data)
+            os.replace(temp_path, self.path)
+            self.__records = 1
+        else:
+            changed = {bit: value for bit, value in sections.items() if self.__written[bit] != value}
+            if not changed:
+                return 0
+            data = pack_record(changed)
+            with open(self.path, "ab") as file:
+                file.write(data)
+            self.__records += 1
+        self.__written = sections
+        self.bytes_written += len(data)
+        return len(data)
+
+    def load(self, game_manager):
+        """Restore GameManager dari file. Save berikutnya menulis file penuh (buang record rusak)"""
+        with open(self.path, "rb") as file:
+            restore(game_manager, file.read())
+        self.__written = None
+        self.__ticks = 0
+        return game_manager
+
+    def discard(self):
+        """Hapus save (game selesai)"""
+        self.__written = None
+        self.__ticks = 0
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,110 @@
+# classes/session_host.py
+# Banyak GameManager dalam satu proses (dipakai server.py dan bot load test)
+import time
+from collections import deque
+
+from Class.Game_Manager import GameManager
+from Class.Input_Log import decode_frame
+from Class.Session_Protocol import capture_fields, encode_delta
+
+
+class Session:
+    """Satu pemain: GameManager + input terakhir + state yang terakhir dikirim"""
+
+    def __init__(self, session_id, game_manager, player_name="Player"):
+        self.session_id = session_id
+        self.game_manager = game_manager
+        self.player_name = player_name
+        self.keys = None  # Tombol gerak yang sedang ditekan
+        self.answer_index = None  # Jawaban untuk tick berikutnya (hanya yang pertama)
+        self.sent_fields = None  # Field terakhir yang dikirim ke client (untuk delta)
+
+    def set_input(self, value):
+        """value = 1 byte dari Input_Log.encode_frame"""
+        keys, answer_index = decode_frame(value)
+        self.keys = keys
+        if answer_index is not None and self.answer_index is None:
+            self.answer_index = answer_index
+
+    def make_delta(self, tick):
+        """Return pesan delta sejak pengiriman terakhir (None kalau tidak ada perubahan)"""
+        fields = capture_fields(self.game_manager)
+        message = encode_delta(tick, fields, self.sent_fields)
+        self.sent_fields = fields
+        return message
+
+
+class SessionHost:
+    """
+    Class untuk menjalankan banyak sesi dengan satu tick bersama
+    Setiap tick semua sesi di-step berurutan per batch (tanpa thread per sesi)
+    """
+
+    STATIC_STATES = ("MENU", "GAME_OVER", "WIN")
+
+    def __init__(self, tick_rate=60, screen_width=800, screen_height=600, use_entity_store=False):
+        self.tick_rate = tick_rate
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.use_entity_store = use_entity_store
+        self.tick = 0
+        self.sessions = {}  # {id: Session}
+        self.__next_id = 1
+        self.__tick_times = deque(maxlen=3600)  # ms untuk step semua sesi per tick
+
+    def create_session(self, player_name="Player", seed=None):
+        game_manager = GameManager(self.screen_width, self.screen_height, verbose=False,
+                                   use_entity_store=self.use_entity_store, tick_rate=self.tick_rate)
+        game_manager.start_game(player_name, seed=seed)
+        session = Session(self.__next_id, game_manager, player_name)
+        self.sessions[session.session_id] = session
+        self.__next_id += 1
+        return session
+
+    def restart_session(self, session_id):
+        session = self.sessions[session_id]
+        session.game_manager.start_game(session.player_name)
+        session.keys = None
+        session.answer_index = None
+        return session
+
+    def remove_session(self, session_id):
+        self.sessions.pop(session_id, None)
+
+    def batches(self, batch_size):
+        """Bagi sesi jadi beberapa batch (server memberi giliran ke network di antara batch)"""
+        sessions = list(self.sessions.values())
+        for start in range(0, len(sessions), batch_size):
+            yield sessions[start:start + batch_size]
+
+    def step_batch(self, sessions):
+        """Step satu tick untuk setiap sesi di batch (sesi di layar statis dilewati)"""
+        for session in sessions:
+            game_manager = session.game_manager
+            if game_manager.game_state in self.STATIC_STATES:
+                continue
+            game_manager.step_frame(session.keys, session.answer_index)
+            session.answer_index = None
+
+    def step(self, batch_size=None):
+        """Satu tick untuk semua sesi. Return ms"""
+        start = time.perf_counter()
+        for batch in self.batches(batch_size or max(1, len(self.sessions))):
+            self.step_batch(batch)
+        return self.finish_tick(start)
+
+    def finish_tick(self, start):
+        """Catat waktu tick yang dimulai pada perf_counter() = start. Return ms"""
+        elapsed = (time.perf_counter() - start) * 1000
+        self.__tick_times.append(elapsed)
+        self.tick += 1
+        return elapsed
+
+    def get_metrics(self, percentiles=(50, 99)):
+        times = sorted(self.__tick_times)
+        metrics = {'sessions': len(self.sessions), 'ticks': self.tick}
+        if times:
+            for p in percentiles:
+                metrics[f'tick_ms_p{p}'] = times[int(p / 100 * (len(times) - 1))]
+            metrics['tick_ms_max'] = times[-1]
+        return metrics
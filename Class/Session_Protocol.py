@@ -0,0 +1,163 @@
+# classes/session_protocol.py
+# Format pesan biner antara server.py dan client (TCP)
+# Setiap pesan: panjang payload (uint32) + tipe (uint8) + payload
+import struct
+
+MAGIC = b"MASV"
+VERSION = 2  # 2: header dan jumlah monster uint32, jumlah pilihan uint16
+
+MSG_JOIN = 1  # client -> server: seed (opsional) + nama
+MSG_INPUT = 2  # client -> server: 1 byte input (format Input_Log.encode_frame)
+MSG_RESTART = 3  # client -> server: mulai sesi baru setelah GAME_OVER / WIN
+MSG_WELCOME = 10  # server -> client: id sesi + seed
+MSG_DELTA = 11  # server -> client: hanya field state yang berubah
+
+STATES = ("MENU", "PLAYING", "QUESTION", "GAME_OVER", "WIN")
+KINDS = ("monster", "boss")
+
+# Bit field di pesan delta
+FIELD_STATE = 1
+FIELD_POSITION = 2
+FIELD_STATS = 4
+FIELD_MONSTERS = 8
+FIELD_QUESTION = 16
+FIELD_TIMER = 32
+
+_HEADER = struct.Struct("<IB")  # panjang payload, tipe
+HEADER_SIZE = _HEADER.size
+_JOIN = struct.Struct("<4sBBQ")  # magic, versi, ada seed?, seed
+_WELCOME = struct.Struct("<IQ")  # id sesi, seed
+_DELTA = struct.Struct("<IB")  # tick, field yang berubah
+_POSITION = struct.Struct("<hh")
+_STATS = struct.Struct("<hIBBH")  # health, score, level, lives, monsters_defeated
+_MONSTER = struct.Struct("<IBhhB")  # handle, kind, x, y, difficulty
+_COUNT = struct.Struct("<I")  # jumlah monster (bisa ribuan dengan MonsterStore)
+_OPTION_COUNT = struct.Struct("<H")
+
+
+def pack_message(message_type, payload=b""):
+    return _HEADER.pack(len(payload), message_type) + payload
+
+
+async def read_message(reader):
+    """Baca satu pesan dari asyncio.StreamReader. Return (tipe, payload)"""
+    length, message_type = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+    payload = await reader.readexactly(length) if length else b""
+    return message_type, payload
+
+
+# ===== Join / welcome =====
+def encode_join(player_name, seed=None):
+    name = player_name.encode("utf-8")[:255]
+    return pack_message(MSG_JOIN, _JOIN.pack(MAGIC, VERSION, seed is not None, seed or 0) + name)
+
+
+def decode_join(payload):
+    if len(payload) < _JOIN.size:
+        raise ValueError("Pesan join terlalu pendek")
+    magic, version, has_seed, seed = _JOIN.unpack_from(payload, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Bukan client Math Adventure (atau versi berbeda)")
+    return payload[_JOIN.size:].decode("utf-8"), (seed if has_seed else None)
+
+
+def encode_welcome(session_id, seed):
+    return pack_message(MSG_WELCOME, _WELCOME.pack(session_id, seed))
+
+
+def decode_welcome(payload):
+    return _WELCOME.unpack(payload)
+
+
+# ===== State delta =====
+def capture_fields(game_manager):
+    """Return {bit field: nilai} dari GameManager (nilai bisa dibandingkan dengan ==)"""
+    player = game_manager.player
+    question = game_manager.current_question
+    return {
+        FIELD_STATE: game_manager.game_state,
+        FIELD_POSITION: player.get_position(),
+        FIELD_STATS: (player.get_health(), player.get_score(), player.get_level(), player.get_lives(),
+                      game_manager.monsters_defeated),
+        FIELD_MONSTERS: tuple((monster.get_handle(), monster.kind) + monster.get_position() + (monster.get_difficulty(),)
+                              for monster in game_manager.monsters),
+        FIELD_QUESTION: None if question is None else (question.get_question_text(), tuple(question.get_options())),
+        FIELD_TIMER: game_manager.get_remaining_time(),
+    }
+
+
+def encode_delta(tick, fields, previous=None):
+    """
+    Pesan delta berisi field yang berbeda dari previous (None = kirim semua)
+    Return bytes pesan, atau None kalau tidak ada yang berubah
+    """
+    mask = 0
+    parts = []
+    for field, value in fields.items():
+        if previous is not None and previous.get(field) == value:
+            continue
+        mask |= field
+        parts.append(_encode_field(field, value))
+    if not mask:
+        return None
+    return pack_message(MSG_DELTA, _DELTA.pack(tick, mask) + b"".join(parts))
+
+
+def _encode_field(field, value):
+    if field == FIELD_STATE:
+        return bytes((STATES.index(value),))
+    if field == FIELD_POSITION:
+        return _POSITION.pack(*value)
+    if field == FIELD_STATS:
+        return _STATS.pack(*value)
+    if field == FIELD_MONSTERS:
+        return _COUNT.pack(len(value)) + b"".join(
+            _MONSTER.pack(handle, KINDS.index(kind), x, y, difficulty) for handle, kind, x, y, difficulty in value)
+    if field == FIELD_QUESTION:
+        if value is None:
+            return b"\x00" + _OPTION_COUNT.pack(0)
+        text = value[0].encode("utf-8")[:255]
+        return (bytes((len(text),)) + text + _OPTION_COUNT.pack(len(value[1]))
+                + struct.pack(f"<{len(value[1])}i", *value[1]))
+    if field == FIELD_TIMER:
+        return struct.pack("<H", value)
+    raise ValueError(f"Field tidak dikenal: {field}")
+
+
+def apply_delta(state, payload):
+    """Terapkan payload MSG_DELTA ke dict state milik client. Return state"""
+    tick, mask = _DELTA.unpack_from(payload, 0)
+    offset = _DELTA.size
+    state['tick'] = tick
+
+    if mask & FIELD_STATE:
+        state['game_state'] = STATES[payload[offset]]
+        offset += 1
+    if mask & FIELD_POSITION:
+        state['position'] = _POSITION.unpack_from(payload, offset)
+        offset += _POSITION.size
+    if mask & FIELD_STATS:
+        health, score, level, lives, defeated = _STATS.unpack_from(payload, offset)
+        state.update(health=health, score=score, level=level, lives=lives, monsters_defeated=defeated)
+        offset += _STATS.size
+    if mask & FIELD_MONSTERS:
+        (count,) = _COUNT.unpack_from(payload, offset)
+        offset += _COUNT.size
+        monsters = []
+        for _ in range(count):
+            handle, kind, x, y, difficulty = _MONSTER.unpack_from(payload, offset)
+            monsters.append((handle, KINDS[kind], x, y, difficulty))
+            offset += _MONSTER.size
+        state['monsters'] = monsters
+    if mask & FIELD_QUESTION:
+        text_length = payload[offset]
+        text = payload[offset + 1:offset + 1 + text_length].decode("utf-8")
+        offset += 1 + text_length
+        (option_count,) = _OPTION_COUNT.unpack_from(payload, offset)
+        offset += _OPTION_COUNT.size
+        options = list(struct.unpack_from(f"<{option_count}i", payload, offset))
+        offset += 4 * option_count
+        state['question'] = (text, options) if text_length else None
+    if mask & FIELD_TIMER:
+        (state['remaining_time'],) = struct.unpack_from("<H", payload, offset)
+    return state
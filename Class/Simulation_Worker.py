@@ -0,0 +1,135 @@
+# classes/simulation_worker.py
+import threading
+import time
+from collections import deque
+
+from Class.Game_Snapshot import capture
+
+
+class SimulationWorker:
+    """
+    Class untuk menjalankan GameManager di thread sendiri dengan tick rate tetap
+    - Setiap tick menerbitkan GameSnapshot baru (immutable), renderer membaca tanpa lock
+    - Input dari main thread lewat deque (append / popleft atomic, tanpa lock)
+    - Semua perubahan lain ke GameManager dikirim dengan submit() supaya jalan di thread ini
+    """
+
+    STATIC_STATES = ("MENU", "GAME_OVER", "WIN")
+
+    def __init__(self, game_manager, tick_rate=60, max_catch_up_steps=5, after_step=None, on_state_change=None):
+        self.game_manager = game_manager
+        self.tick_rate = tick_rate
+        self.max_catch_up_steps = max_catch_up_steps
+        self.after_step = after_step  # Dipanggil di thread simulasi setelah setiap tick
+        self.on_state_change = on_state_change  # Dipanggil di thread simulasi, mis. untuk post event pygame
+        self.__keys = None  # Tombol gerak yang sedang ditekan (diganti utuh, tidak diubah)
+        self.__answers = deque()  # Pilihan jawaban (0-3)
+        self.__commands = deque()  # (function, args)
+        self.__wake = threading.Event()
+        self.__stop = threading.Event()
+        self.__thread = None
+        self.__tick = 0
+        self.__tick_times = deque(maxlen=600)  # ms per tick terakhir
+
+        snapshot = capture(game_manager, 0, time.perf_counter())
+        self.__snapshots = (snapshot, snapshot)  # (sebelumnya, terbaru), diganti dengan satu assignment
+
+    # ===== Main thread =====
+    def start(self):
+        self.__stop.clear()
+        self.__thread = threading.Thread(target=self.__run, name="simulation", daemon=True)
+        self.__thread.start()
+
+    def stop(self, timeout=1.0):
+        self.__stop.set()
+        self.__wake.set()
+        if self.__thread is not None:
+            self.__thread.join(timeout)
+            self.__thread = None
+
+    def set_keys(self, keys):
+        self.__keys = tuple(keys)
+
+    def answer(self, index):
+        self.__answers.append(index)
+        self.__wake.set()
+
+    def submit(self, function, *args):
+        """Jalankan function(*args) di thread simulasi sebelum tick berikutnya"""
+        self.__commands.append((function, args))
+        self.__wake.set()
+
+    def get_snapshot(self):
+        return self.__snapshots[1]
+
+    def get_snapshots(self):
+        """Return (snapshot sebelumnya, snapshot terbaru) untuk interpolasi"""
+        return self.__snapshots
+
+    def get_stats(self):
+        times = sorted(self.__tick_times)
+        if not times:
+            return {'ticks': self.__tick}
+        return {
+            'ticks': self.__tick,
+            'tick_ms_p50': times[len(times) // 2],
+            'tick_ms_p99': times[int(0.99 * (len(times) - 1))]
+        }
+
+    # ===== Thread simulasi =====
+    def __run(self):
+        step = 1.0 / self.tick_rate
+        next_tick = time.perf_counter()
+        while not self.__stop.is_set():
+            state = self.game_manager.game_state
+            changed = self.__run_commands()
+
+            if self.game_manager.game_state in self.STATIC_STATES:
+                # Layar statis: tidak ada yang disimulasikan, tidur sampai ada perintah
+                self.__answers.clear()
+                if changed:
+                    self.__publish(state)
+                self.__wake.wait(0.5)
+                self.__wake.clear()
+                next_tick = time.perf_counter()
+                continue
+
+            steps = 0
+            while time.perf_counter() >= next_tick and steps < self.max_catch_up_steps:
+                start = time.perf_counter()
+                self.__step()
+                self.__tick_times.append((time.perf_counter() - start) * 1000)
+                self.__publish(state)
+                state = self.game_manager.game_state
+                next_tick += step
+                steps += 1
+
+            now = time.perf_counter()
+            if now - next_tick >= step:
+                next_tick = now  # Terlalu tertinggal: buang sisa waktu (game melambat, bukan freeze)
+            self.__stop.wait(max(0.0, next_tick - now))
+
+    def __run_commands(self):
+        ran = False
+        while self.__commands:
+            function, args = self.__commands.popleft()
+            function(*args)
+            ran = True
+        return ran
+
+    def __step(self):
+        # Hanya jawaban pertama yang dipakai, sama seperti satu frame di main loop
+        answers = []
+        while self.__answers:
+            answers.append(self.__answers.popleft())
+        answer_index = answers[0] if answers else None
+        self.game_manager.step_frame(self.__keys, answer_index)
+        self.__tick += 1
+        if self.after_step is not None:
+            self.after_step()
+
+    def __publish(self, previous_state):
+        snapshot = capture(self.game_manager, self.__tick, time.perf_counter())
+        self.__snapshots = (self.__snapshots[1], snapshot)
+        if snapshot.game_state != previous_state and self.on_state_change is not None:
+            self.on_state_change()
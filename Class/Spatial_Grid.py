@@ -0,0 +1,63 @@
+# classes/spatial_grid.py
+
+
+class SpatialGrid:
+    """
+    Class uniform grid (spatial hash) untuk mencari monster yang dekat player
+    Collision cukup cek cell di sekitar player, tidak perlu semua monster
+    """
+
+    def __init__(self, cell_size=100):
+        self.cell_size = cell_size
+        self.__cells = {}  # {(cell_x, cell_y): set(entity)}
+        self.__entity_cells = {}  # {entity: (cell_x, cell_y)}
+
+    def __cell_of(self, x, y):
+        return (int(x // self.cell_size), int(y // self.cell_size))
+
+    def insert(self, entity, x, y):
+        cell = self.__cell_of(x, y)
+        self.__entity_cells[entity] = cell
+        self.__cells.setdefault(cell, set()).add(entity)
+
+    def remove(self, entity):
+        cell = self.__entity_cells.pop(entity, None)
+        if cell is None:
+            return
+        members = self.__cells[cell]
+        members.discard(entity)
+        if not members:
+            del self.__cells[cell]
+
+    def move(self, entity, x, y):
+        """Update cell entity setelah bergerak (hanya kerja kalau pindah cell)"""
+        cell = self.__cell_of(x, y)
+        old_cell = self.__entity_cells.get(entity)
+        if cell == old_cell:
+            return
+        if old_cell is not None:
+            self.remove(entity)
+        self.__entity_cells[entity] = cell
+        self.__cells.setdefault(cell, set()).add(entity)
+
+    def query(self, x, y, radius):
+        """Return entity di semua cell yang bersinggungan dengan kotak (x, y) +- radius"""
+        min_x, min_y = self.__cell_of(x - radius, y - radius)
+        max_x, max_y = self.__cell_of(x + radius, y + radius)
+        found = []
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                members = self.__cells.get((cell_x, cell_y))
+                if members:
+                    found.extend(members)
+        return found
+
+    def clear(self):
+        self.__cells = {}
+        self.__entity_cells = {}
+
+    def __len__(self):
+        return len(self.__entity_cells)
+
+    def __contains__(self, entity):
+        return entity in self.__entity_cells
@@ -0,0 +1,43 @@
+# classes/sprite_batch.py
+
+
+class SpriteBatch:
+    """
+    Class untuk mengumpulkan blit satu frame per layer
+    flush() mengirim setiap layer dengan satu Surface.blits() (urutan layer tetap)
+    """
+
+    LAYERS = ("entities", "label_bg", "labels", "hud")
+
+    def __init__(self, layers=LAYERS):
+        self.layers = tuple(layers)
+        self.__blits = {layer: [] for layer in self.layers}
+        self.__flushed_blits = 0
+        self.__blits_calls = 0
+
+    def add(self, layer, image, position):
+        self.__blits[layer].append((image, position))
+
+    def add_group(self, layer, group):
+        """Tambah semua sprite dari pygame.sprite.Group (pakai sprite.image + sprite.rect)"""
+        self.__blits[layer].extend((sprite.image, sprite.rect) for sprite in group)
+
+    def flush(self, surface):
+        """Gambar semua layer ke surface lalu kosongkan. Return jumlah blit"""
+        count = 0
+        for layer in self.layers:
+            blits = self.__blits[layer]
+            if not blits:
+                continue
+            surface.blits(blits, doreturn=False)
+            count += len(blits)
+            self.__blits_calls += 1
+            blits.clear()
+        self.__flushed_blits += count
+        return count
+
+    def get_stats(self):
+        return {
+            'blits': self.__flushed_blits,
+            'blits_calls': self.__blits_calls
+        }
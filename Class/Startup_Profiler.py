@@ -0,0 +1,35 @@
+# classes/startup_profiler.py
+import time
+
+
+class StartupProfiler:
+    """
+    Class untuk mengukur waktu startup per fase (imports, display, fonts, assets, ...)
+    Panggil mark("nama fase") setiap kali satu fase selesai
+    """
+
+    def __init__(self, start_time=None):
+        self.__start = start_time if start_time is not None else time.perf_counter()
+        self.__last = self.__start
+        self.__phases = []  # [(nama, detik)]
+
+    def mark(self, name):
+        now = time.perf_counter()
+        self.__phases.append((name, now - self.__last))
+        self.__last = now
+
+    def get_phases(self):
+        return list(self.__phases)
+
+    def get_total(self):
+        return self.__last - self.__start
+
+    def report(self):
+        """Return list baris teks untuk ditampilkan"""
+        total = self.get_total()
+        lines = ["=== Startup Time ==="]
+        for name, seconds in self.__phases:
+            percent = seconds / total * 100 if total > 0 else 0
+            lines.append(f"  {name:<18} {seconds * 1000:8.1f} ms  {percent:5.1f}%")
+        lines.append(f"  {'TOTAL':<18} {total * 1000:8.1f} ms")
+        return lines
@@ -0,0 +1,61 @@
+# classes/surface_pool.py
+import pygame
+
+
+class SurfacePool:
+    """
+    Class untuk surface latar polos (overlay, panel HUD, latar label) dan lingkaran fallback
+    Dibuat sekali per (ukuran, warna, alpha) lalu dipakai ulang setiap frame
+    Surface dari pool hanya untuk di-blit, jangan digambar / diubah
+    """
+
+    def __init__(self):
+        self.__surfaces = {}  # {(ukuran, warna, alpha): Surface}
+        self.__allocations = 0
+        self.__reuses = 0
+
+    def get(self, size, color=(0, 0, 0), alpha=None):
+        key = (tuple(size), tuple(color), alpha)
+        surface = self.__surfaces.get(key)
+        if surface is not None:
+            self.__reuses += 1
+            return surface
+
+        surface = pygame.Surface(key[0])
+        if alpha is not None:
+            surface.set_alpha(alpha)
+        surface.fill(color)
+        self.__surfaces[key] = surface
+        self.__allocations += 1
+        return surface
+
+    def get_circle(self, radius, color):
+        """
+        Lingkaran polos (pengganti sprite yang tidak ada), bisa di-blit seperti sprite
+        Hasilnya sama persis dengan pygame.draw.circle kalau di-blit dengan get_rect(center=...)
+        """
+        key = ("circle", radius, tuple(color))
+        surface = self.__surfaces.get(key)
+        if surface is not None:
+            self.__reuses += 1
+            return surface
+
+        colorkey = (255, 0, 255) if tuple(color) != (255, 0, 255) else (0, 0, 0)
+        surface = pygame.Surface((radius * 2 + 2, radius * 2 + 2))
+        surface.fill(colorkey)
+        pygame.draw.circle(surface, color, (radius + 1, radius + 1), radius)
+        surface.set_colorkey(colorkey)
+        self.__surfaces[key] = surface
+        self.__allocations += 1
+        return surface
+
+    def clear(self):
+        self.__surfaces = {}
+
+    def get_stats(self):
+        """allocations tidak bertambah lagi setelah semua layar pernah tampil"""
+        return {
+            'surfaces': len(self.__surfaces),
+            'allocations': self.__allocations,
+            'reuses': self.__reuses
+        }
@@ -0,0 +1,47 @@
+# classes/text_cache.py
+from collections import OrderedDict
+
+
+class TextCache:
+    """
+    Class untuk cache hasil font.render (LRU)
+    Teks yang sama tidak perlu di-render ulang setiap frame
+    """
+
+    def __init__(self, max_size=256):
+        self.__max_size = max_size
+        self.__surfaces = OrderedDict()  # {(font, text, antialias, color): Surface}
+        self.__hits = 0
+        self.__misses = 0
+
+    def render(self, font, text, antialias, color):
+        """Pengganti font.render(text, antialias, color)"""
+        key = (font, text, antialias, color)
+        surface = self.__surfaces.get(key)
+
+        if surface is not None:
+            self.__hits += 1
+            self.__surfaces.move_to_end(key)
+            return surface
+
+        self.__misses += 1
+        surface = font.render(text, antialias, color)
+        self.__surfaces[key] = surface
+
+        # Buang yang paling lama tidak dipakai
+        if len(self.__surfaces) > self.__max_size:
+            self.__surfaces.popitem(last=False)
+
+        return surface
+
+    def clear(self):
+        self.__surfaces.clear()
+
+    def get_stats(self):
+        """Return statistik cache"""
+        return {
+            'hits': self.__hits,
+            'misses': self.__misses,
+            'size': len(self.__surfaces),
+            'max_size': self.__max_size
+        }
@@ -0,0 +1,305 @@
+# tools/balance_sweep.py
+# Monte Carlo balancing: banyak sesi headless (BotPlayer) untuk setiap kombinasi parameter
+# Hasil per chunk ditulis langsung ke file JSONL, sweep yang terhenti bisa dilanjutkan
+# Jalankan dari root project:
+#   python -m Tools.balance_sweep --grid game.question_seconds=10,20,30 --grid bot.accuracy=0.6,0.8
+#   python -m Tools.balance_sweep ... --sessions 100000            (jalankan lagi = lanjut dari file)
+#   python -m Tools.balance_sweep --report                         (ringkasan dari file saja)
+import argparse
+import itertools
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from Class.Bot_Player import BotPlayer
+from Class.Game_Manager import GameManager
+from Class.Monster import Monster, Boss
+from Class.Player import Player
+
+DEFAULT_OUTPUT = os.path.join("Balance", "sweep.jsonl")
+TICK_RATE = 60
+TIME_BIN = 10  # Detik per bin histogram waktu
+
+# Parameter yang bisa di-sweep: nama -> (class, atribut) untuk konstanta class
+CLASS_PARAMETERS = {
+    "monster.base_health": (Monster, "BASE_HEALTH"),
+    "monster.health_per_difficulty": (Monster, "HEALTH_PER_DIFFICULTY"),
+    "monster.reward_per_difficulty": (Monster, "REWARD_PER_DIFFICULTY"),
+    "monster.base_speed": (Monster, "BASE_SPEED"),
+    "monster.base_damage": (Monster, "BASE_DAMAGE"),
+    "monster.damage_per_difficulty": (Monster, "DAMAGE_PER_DIFFICULTY"),
+    "boss.difficulty_bonus": (Boss, "DIFFICULTY_BONUS"),
+    "boss.attack_multiplier": (Boss, "ATTACK_MULTIPLIER"),
+    "player.score_per_level": (Player, "SCORE_PER_LEVEL"),
+    "player.level_up_health": (Player, "LEVEL_UP_HEALTH"),
+    "player.max_level": (Player, "MAX_LEVEL"),  # Juga level final boss
+}
+# Nilai asli, dipasang ulang sebelum setiap chunk (proses worker dipakai ulang)
+CLASS_DEFAULTS = {name: getattr(owner, attribute) for name, (owner, attribute) in CLASS_PARAMETERS.items()}
+
+# Parameter per GameManager / BotPlayer: nama -> nilai default
+GAME_PARAMETERS = {"game.spawn_seconds": 3, "game.question_seconds": 30, "game.boss_every": 5,
+                   "game.max_monsters": 3}
+BOT_PARAMETERS = {"bot.accuracy": 0.8, "bot.reaction_mean": 2.0, "bot.reaction_sd": 0.75}
+
+DEFAULT_GRID = {"game.question_seconds": [10, 20, 30], "bot.accuracy": [0.6, 0.8, 0.95]}
+
+
+def apply_class_parameters(config):
+    for name, (owner, attribute) in CLASS_PARAMETERS.items():
+        setattr(owner, attribute, config.get(name, CLASS_DEFAULTS[name]))
+
+
+def new_session(config, seed, tick_rate):
+    game_manager = GameManager(verbose=False, tick_rate=tick_rate)
+    game_manager.spawn_interval = round(config.get("game.spawn_seconds", GAME_PARAMETERS["game.spawn_seconds"]) * tick_rate)
+    game_manager.question_time_limit = round(
+        config.get("game.question_seconds", GAME_PARAMETERS["game.question_seconds"]) * tick_rate)
+    game_manager.boss_every = int(config.get("game.boss_every", GAME_PARAMETERS["game.boss_every"]))
+    game_manager.max_monsters = int(config.get("game.max_monsters", GAME_PARAMETERS["game.max_monsters"]))
+    game_manager.start_game("Bot", seed=seed)
+
+    # Seed bot diturunkan dari seed sesi, supaya stream-nya tidak sama dengan game_manager.rng
+    bot_seed = random.Random(f"bot {seed}").getrandbits(32)
+    bot = BotPlayer(config.get("bot.accuracy", BOT_PARAMETERS["bot.accuracy"]),
+                    config.get("bot.reaction_mean", BOT_PARAMETERS["bot.reaction_mean"]),
+                    config.get("bot.reaction_sd", BOT_PARAMETERS["bot.reaction_sd"]),
+                    random.Random(bot_seed), tick_rate)
+    return game_manager, bot
+
+
+def add_count(histogram, key):
+    histogram[str(key)] = histogram.get(str(key), 0) + 1
+
+
+def simulate_chunk(config, first_seed, sessions, max_ticks, tick_rate=TICK_RATE):
+    """
+    Jalankan sesi dengan seed first_seed .. first_seed + sessions - 1 (jalan di proses worker)
+    Return ringkasan chunk: jumlah + histogram (mudah digabung dan kecil di file)
+    """
+    apply_class_parameters(config)
+    result = {'sessions': sessions, 'wins': 0, 'game_overs': 0, 'timeouts': 0, 'ticks': 0,
+              'boss_seconds': {}, 'win_seconds': {}, 'deaths': {}, 'game_over_levels': {}}
+
+    for seed in range(first_seed, first_seed + sessions):
+        game_manager, bot = new_session(config, seed, tick_rate)
+        player = game_manager.player
+        lives = player.get_lives()
+        boss_tick = None
+        tick = 0
+        while tick < max_ticks and game_manager.game_state not in ("GAME_OVER", "WIN"):
+            keys, answer_index = bot.decide(game_manager)
+            game_manager.step_frame(keys, answer_index)
+            tick += 1
+            if boss_tick is None and game_manager.final_boss_spawned:
+                boss_tick = tick
+                add_count(result['boss_seconds'], tick // tick_rate // TIME_BIN * TIME_BIN)
+            if player.get_lives() != lives:
+                lives = player.get_lives()
+                add_count(result['deaths'], player.get_level())  # Level saat nyawa hilang
+
+        result['ticks'] += tick
+        if game_manager.game_state == "WIN":
+            result['wins'] += 1
+            add_count(result['win_seconds'], tick // tick_rate // TIME_BIN * TIME_BIN)
+        elif game_manager.game_state == "GAME_OVER":
+            result['game_overs'] += 1
+            add_count(result['game_over_levels'], player.get_level())
+        else:
+            result['timeouts'] += 1
+
+    apply_class_parameters({})
+    return result
+
+
+def parse_grid(specs):
+    """["game.question_seconds=10,20", ...] -> {nama: [nilai, ...]}"""
+    known = set(CLASS_PARAMETERS) | set(GAME_PARAMETERS) | set(BOT_PARAMETERS)
+    grid = {}
+    for spec in specs:
+        name, _, values = spec.partition("=")
+        if name not in known:
+            raise ValueError(f"Parameter tidak dikenal: {name} (pilihan: {', '.join(sorted(known))})")
+        grid[name] = [int(value) if float(value).is_integer() else float(value)
+                      for value in (float(text) for text in values.split(","))]
+    return grid
+
+
+def expand_grid(grid):
+    names = sorted(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+
+
+def config_key(config):
+    return json.dumps(config, sort_keys=True)
+
+
+def load_results(path):
+    """Return (settings dari header, {(config_key, chunk): [record, ...]})"""
+    settings = None
+    done = {}
+    if not os.path.exists(path):
+        return settings, done
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # Baris terakhir bisa terpotong kalau proses dihentikan paksa
+            if 'settings' in record:
+                settings = record['settings']
+            else:
+                done.setdefault((config_key(record['config']), record['chunk']), []).append(record)
+    return settings, done
+
+
+def select_records(records, wanted):
+    """
+    Pilih record satu chunk yang berurutan dari sesi ke-0 dan total tepat <= wanted
+    Return (record terpilih, jumlah sesi yang sudah ada). Sisanya perlu dijalankan (top up)
+    """
+    selected = []
+    covered = 0
+    # Record paling besar dulu untuk setiap posisi awal
+    candidates = sorted(records, key=lambda record: (record.get('start', 0), -record['result']['sessions']))
+    for record in candidates:
+        sessions = record['result']['sessions']
+        if record.get('start', 0) == covered and covered + sessions <= wanted:
+            selected.append(record)
+            covered += sessions
+    return selected, covered
+
+
+def chunk_plan(sessions, chunk_size):
+    """Return [(chunk, jumlah sesi)] untuk --sessions"""
+    return [(chunk, min(chunk_size, sessions - chunk * chunk_size)) for chunk in range(-(-sessions // chunk_size))]
+
+
+def merge(records):
+    total = {'sessions': 0, 'wins': 0, 'game_overs': 0, 'timeouts': 0, 'ticks': 0,
+             'boss_seconds': {}, 'win_seconds': {}, 'deaths': {}, 'game_over_levels': {}}
+    for record in records:
+        for key, value in record['result'].items():
+            if isinstance(value, dict):
+                for bucket, count in value.items():
+                    total[key][bucket] = total[key].get(bucket, 0) + count
+            else:
+                total[key] += value
+    return total
+
+
+def histogram_percentile(histogram, p):
+    """Persentil dari histogram {bin: count} (hasil dalam resolusi bin)"""
+    items = sorted((int(bucket), count) for bucket, count in histogram.items())
+    target = p / 100 * sum(count for _, count in items)
+    seen = 0
+    for bucket, count in items:
+        seen += count
+        if seen >= target:
+            return bucket
+    return None
+
+
+def report(done, sessions=None, chunk_size=None, tick_rate=TICK_RATE):
+    """Ringkasan per konfigurasi. sessions=None = semua chunk yang ada di file"""
+    wanted = None if sessions is None else dict(chunk_plan(sessions, chunk_size))
+    by_config = {}
+    for (key, chunk), records in done.items():
+        if wanted is not None and chunk not in wanted:
+            continue
+        selected, _ = select_records(records, float("inf") if wanted is None else wanted[chunk])
+        by_config.setdefault(key, []).extend(selected)
+
+    print(f"{'config':<58} {'sessions':>9} {'win':>6} {'over':>6} {'t/o':>5} {'boss p10/p50/p90 s':>20}  deaths by level")
+    for key in sorted(by_config):
+        total = merge(by_config[key])
+        sessions = max(1, total['sessions'])
+        boss = total['boss_seconds']
+        boss_text = "-" if not boss else "/".join(
+            str(histogram_percentile(boss, p)) for p in (10, 50, 90))
+        deaths = sum(total['deaths'].values())
+        death_text = " ".join(f"L{level}:{count / deaths:.0%}"
+                              for level, count in sorted(total['deaths'].items(), key=lambda item: int(item[0])))
+        label = ", ".join(f"{name}={value}" for name, value in json.loads(key).items()) or "(default)"
+        print(f"{label:<58} {total['sessions']:>9} {total['wins'] / sessions:>6.1%} "
+              f"{total['game_overs'] / sessions:>6.1%} {total['timeouts'] / sessions:>5.1%} {boss_text:>20}  "
+              f"{death_text or '-'}")
+        print(f"{'':<58} {'':>9} avg {total['ticks'] / sessions / tick_rate:.0f} s/session, "
+              f"reached final boss {sum(boss.values()) / sessions:.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo balancing Math Adventure (process pool)")
+    parser.add_argument("--grid", action="append", default=[], metavar="NAME=V1,V2",
+                        help="parameter dan nilai yang dicoba (bisa diulang)")
+    parser.add_argument("--sessions", type=int, help="sesi per konfigurasi (default 2000, --report: semua)")
+    parser.add_argument("--chunk-size", type=int, default=100, help="sesi per task worker")
+    parser.add_argument("--max-seconds", type=float, default=1200, help="batas waktu game per sesi")
+    parser.add_argument("--seed", type=int, default=0, help="seed pertama (sama untuk semua konfigurasi)")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="file JSONL hasil (dipakai untuk resume)")
+    parser.add_argument("--fresh", action="store_true", help="hapus hasil lama, mulai dari awal")
+    parser.add_argument("--report", action="store_true", help="hanya tampilkan ringkasan dari --output")
+    args = parser.parse_args()
+
+    if args.fresh and os.path.exists(args.output):
+        os.remove(args.output)
+    settings, done = load_results(args.output)
+    if args.report:
+        report(done, args.sessions, settings['chunk_size'] if settings else args.chunk_size)
+        return
+    if args.sessions is None:
+        args.sessions = 2000
+
+    try:
+        grid = parse_grid(args.grid) if args.grid else DEFAULT_GRID
+    except ValueError as error:
+        parser.error(str(error))
+
+    # Chunk hanya bisa dipakai ulang kalau seed & batas waktunya sama
+    new_settings = {'chunk_size': args.chunk_size, 'max_ticks': round(args.max_seconds * TICK_RATE),
+                    'seed': args.seed, 'tick_rate': TICK_RATE, 'format': 2}
+    if settings is not None and settings != new_settings:
+        parser.error(f"{args.output} dibuat dengan setting lain ({settings}), pakai --fresh atau --output lain")
+
+    # Chunk yang belum ada atau baru sebagian (--sessions diperbesar) dijalankan dari sesi yang kurang
+    tasks = []
+    for config in expand_grid(grid):
+        for chunk, wanted in chunk_plan(args.sessions, args.chunk_size):
+            _, covered = select_records(done.get((config_key(config), chunk), []), wanted)
+            if covered < wanted:
+                tasks.append((config, chunk, covered, wanted - covered))
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    print(f"{len(tasks)} chunks to run ({sum(map(len, done.values()))} records already in {args.output}), "
+          f"{args.processes} processes")
+    start = time.perf_counter()
+    simulated = 0
+    with open(args.output, "a", encoding="utf-8") as file, ProcessPoolExecutor(args.processes) as pool:
+        if settings is None:
+            file.write(json.dumps({'settings': new_settings}) + "\n")
+        futures = {pool.submit(simulate_chunk, config, args.seed + chunk * args.chunk_size + offset, sessions,
+                               new_settings['max_ticks'], TICK_RATE): (config, chunk, offset)
+                   for config, chunk, offset, sessions in tasks}
+        try:
+            for future in as_completed(futures):
+                config, chunk, offset = futures[future]
+                record = {'config': config, 'chunk': chunk, 'start': offset, 'result': future.result()}
+                file.write(json.dumps(record) + "\n")
+                file.flush()  # Setiap chunk langsung di disk, aman untuk resume
+                done.setdefault((config_key(config), chunk), []).append(record)
+                simulated += record['result']['sessions']
+        except KeyboardInterrupt:
+            pool.shutdown(cancel_futures=True)
+            print("Interrupted, run again to resume")
+
+    elapsed = time.perf_counter() - start
+    if simulated:
+        print(f"{simulated} sessions in {elapsed:.1f} s ({simulated / elapsed:.1f} sessions/s)")
+    report(done, args.sessions, args.chunk_size)
+
+
+if __name__ == "__main__":
+    main()
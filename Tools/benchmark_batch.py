@@ -0,0 +1,42 @@
+# tools/benchmark_batch.py
+# Bandingkan draw_game dengan blit satu per satu vs sprite batch (Surface.blits per layer)
+# Jalankan dari root project: python -m Tools.benchmark_batch [--shapes] [--frames N]
+import argparse
+import sys
+
+from Tools import benchmark_render
+from Tools.benchmark_render import game
+
+MONSTER_COUNTS = [10, 100, 1000]
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Benchmark draw_game: blit biasa vs Surface.blits per layer")
+    parser.add_argument("--frames", type=int, default=200, help="jumlah frame per ukuran")
+    parser.add_argument("--shapes", action="store_true", help="tanpa sprite (lingkaran fallback)")
+    args = parser.parse_args(argv)
+
+    if args.shapes:
+        game.get_sprite = lambda name: None
+    else:
+        benchmark_render.wait_for_assets()
+
+    print(f"\n{'monsters':>9} {'blit p50 ms':>12} {'batch p50 ms':>13} {'blit fps':>9} {'batch fps':>10} {'speedup':>8}")
+    for n_monsters in MONSTER_COUNTS:
+        name = f"game.{n_monsters}"
+        benchmark_render.SCENARIOS.setdefault(name, ("draw_game", lambda n=n_monsters: benchmark_render.new_game(n)))
+        results = []
+        for batched in (False, True):
+            game.BATCHED_RENDER = batched
+            results.append(benchmark_render.run_scenario(name, args.frames))
+        single, batch = results
+        print(f"{n_monsters:>9} {single['p50']:>12.3f} {batch['p50']:>13.3f} "
+              f"{single['fps']:>9.0f} {batch['fps']:>10.0f} {single['p50'] / batch['p50']:>7.2f}x")
+    print(f"Surface.blits calls: {game.sprite_batch.get_stats()['blits_calls']}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit_code = main(sys.argv[1:])
+    game.assets.shutdown()
+    sys.exit(exit_code)
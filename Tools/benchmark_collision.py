@@ -0,0 +1,59 @@
+# tools/benchmark_collision.py
+# Bandingkan check_collision() pakai spatial grid vs linear scan (versi lama)
+# Jalankan dari root project: python -m Tools.benchmark_collision
+import random
+import sys
+import timeit
+
+from Class.Game_Manager import GameManager
+from Class.Monster import Monster
+
+
+def linear_check_collision(game_manager):
+    """Versi lama: cek semua monster + akar kuadrat"""
+    player_x, player_y = game_manager.player.get_position()
+    for monster in game_manager.monsters:
+        if game_manager.collision_cooldown.is_active(monster.get_handle()):
+            continue
+        monster_x, monster_y = monster.get_position()
+        distance = ((player_x - monster_x)**2 + (player_y - monster_y)**2)**0.5
+        if distance < game_manager.collision_radius:
+            return True
+    return False
+
+
+def make_horde(n_monsters, cell_size, seed=0):
+    """GameManager dengan n monster tersebar, tidak ada yang menyentuh player"""
+    rng = random.Random(seed)
+    game_manager = GameManager(verbose=False, grid_cell_size=cell_size)
+    game_manager.start_game("Bench")
+    game_manager.remove_monster(game_manager.monsters[0])
+
+    player_x, player_y = game_manager.player.get_position()
+    while len(game_manager.monsters) < n_monsters:
+        x = rng.randint(0, game_manager.screen_width)
+        y = rng.randint(0, game_manager.screen_height)
+        if (x - player_x)**2 + (y - player_y)**2 >= game_manager.collision_radius**2:
+            game_manager.add_monster(Monster(f"Monster {len(game_manager.monsters)}", 1, x, y))
+    return game_manager
+
+
+def bench(function, repeat=5, number=200):
+    best = min(timeit.repeat(function, repeat=repeat, number=number))
+    return best / number * 1e6  # mikrodetik per panggilan
+
+
+def main(argv):
+    cell_sizes = [int(value) for value in argv] or [50, 100, 200]
+
+    print(f"{'monsters':>9} {'cell':>5} {'linear us':>10} {'grid us':>10} {'speedup':>8}")
+    for n_monsters in [3, 30, 300, 3000]:
+        for cell_size in cell_sizes:
+            game_manager = make_horde(n_monsters, cell_size)
+            linear = bench(lambda: linear_check_collision(game_manager))
+            grid = bench(game_manager.check_collision)
+            print(f"{n_monsters:>9} {cell_size:>5} {linear:>10.2f} {grid:>10.2f} {linear / grid:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,81 @@
+# tools/benchmark_entities.py
+# Ukur memory dan kecepatan object Monster/Boss dalam jumlah besar
+# Jalankan dari root project: python -m Tools.benchmark_entities [jumlah]
+import random
+import sys
+import time
+import tracemalloc
+
+from Class.Monster import Monster, Boss
+from Class.Player import Player
+
+
+def make_monsters(n_monsters, seed=0):
+    """Setiap monster ke-10 adalah Boss"""
+    rng = random.Random(seed)
+    monsters = []
+    for i in range(n_monsters):
+        x, y = rng.randint(0, 800), rng.randint(0, 600)
+        if i % 10 == 9:
+            monsters.append(Boss(f"Boss {i}", rng.randint(1, 3), x, y))
+        else:
+            monsters.append(Monster(f"Monster {i}", rng.randint(1, 3), x, y))
+    return monsters
+
+
+def measure_memory(n_monsters):
+    """Return byte per monster (termasuk nama, tanpa list)"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    monsters = make_monsters(n_monsters)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    list_bytes = sys.getsizeof(monsters)
+    return (after - before - list_bytes) / n_monsters
+
+
+def timed(function, repeat=5):
+    """Return detik terbaik dari beberapa percobaan"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(n_monsters=100_000):
+    monsters = make_monsters(n_monsters)
+    player = Player("Bench", verbose=False)
+    player_x, player_y = player.get_position()
+
+    def move_all():
+        for monster in monsters:
+            monster.move_towards_player(player_x, player_y)
+
+    def read_positions():
+        for monster in monsters:
+            monster.get_position()
+
+    def count_bosses():
+        return sum(1 for monster in monsters if monster.kind == "boss")
+
+    results = [
+        ("memory / entity", f"{measure_memory(n_monsters):.0f} B"),
+        ("create", timed(lambda: make_monsters(n_monsters), repeat=3)),
+        ("move_towards_player", timed(move_all)),
+        ("get_position", timed(read_positions)),
+        ("boss check", timed(count_bosses)),
+    ]
+
+    print(f"=== {n_monsters} entities ({count_bosses()} bosses) ===")
+    for name, value in results:
+        if isinstance(value, float):
+            value = f"{value * 1000:8.1f} ms  ({n_monsters / value / 1e6:.2f} M/s)"
+        print(f"  {name:<20} {value}")
+    print(f"  __dict__ per monster: {'yes' if hasattr(monsters[0], '__dict__') else 'no (__slots__)'}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,39 @@
+# tools/benchmark_entity_store.py
+# Bandingkan GameManager.update() object biasa vs MonsterStore (NumPy)
+# Jalankan dari root project: python -m Tools.benchmark_entity_store
+import random
+import timeit
+
+from Class.Game_Manager import GameManager
+from Class.Monster import Monster
+
+
+def make_horde(n_monsters, use_entity_store, seed=0):
+    rng = random.Random(seed)
+    game_manager = GameManager(verbose=False, use_entity_store=use_entity_store)
+    game_manager.start_game("Bench")
+    game_manager.remove_monster(game_manager.monsters[0])
+    game_manager.collision_radius = 0  # Supaya tidak masuk state QUESTION
+    for i in range(n_monsters):
+        x = rng.randint(0, game_manager.screen_width)
+        y = rng.randint(0, game_manager.screen_height)
+        game_manager.add_monster(Monster(f"Monster {i}", rng.randint(1, 3), x, y))
+    return game_manager
+
+
+def main():
+    print(f"{'monsters':>9} {'objects ms':>11} {'store ms':>9} {'speedup':>8}")
+    for n_monsters in [3, 100, 1000, 10000]:
+        results = []
+        for use_entity_store in (False, True):
+            game_manager = make_horde(n_monsters, use_entity_store)
+            number = max(1, 20000 // (n_monsters + 10))
+            best = min(timeit.repeat(game_manager.update, repeat=3, number=number))
+            results.append(best / number * 1000)
+        objects, store = results
+        print(f"{n_monsters:>9} {objects:>11.3f} {store:>9.3f} {objects / store:>7.1f}x")
+    print("Budget 1 frame di 60 FPS = 16.667 ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+# tools/benchmark_render.py
+# Benchmark waktu gambar setiap layar (draw_menu, draw_game, ...) tanpa layar asli (SDL dummy)
+# Jalankan dari root project:
+#   python -m Tools.benchmark_render                    (fps + p50/p99 per draw function)
+#   python -m Tools.benchmark_render --save-golden      (simpan frame acuan ke folder Golden)
+#   python -m Tools.benchmark_render --check-golden     (cek hasil gambar masih sama persis)
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+import main as game
+from Class.Game_Manager import GameManager
+from Class.Monster import Monster, Boss
+from Class.Entity_Store import numpy
+
+GOLDEN_DIR = "Golden"
+SEED = 1234
+
+# Menu tidak boleh tergantung ada tidaknya Save/autosave.mass di folder ini
+game.autosave = None
+
+
+# ===== State sintetis =====
+def new_game(n_monsters=0):
+    game_manager = GameManager(game.SCREEN_WIDTH, game.SCREEN_HEIGHT, verbose=False, tick_rate=game.SIM_TICK_RATE)
+    game_manager.start_game("Player", seed=SEED)
+    for i in range(n_monsters):
+        x = game_manager.rng.randint(0, game.SCREEN_WIDTH)
+        y = game_manager.rng.randint(0, game.SCREEN_HEIGHT)
+        if i % 10 == 9:
+            game_manager.add_monster(Boss(f"Boss {i}", 3, x, y))
+        else:
+            game_manager.add_monster(Monster(f"Monster {i}", game_manager.rng.randint(1, 3), x, y))
+    return game_manager
+
+
+def menu_state():
+    return GameManager(game.SCREEN_WIDTH, game.SCREEN_HEIGHT, verbose=False, tick_rate=game.SIM_TICK_RATE)
+
+
+def low_health_state():
+    game_manager = new_game(10)
+    game_manager.player.set_health(10)
+    return game_manager
+
+
+def question_state(remaining_seconds=None):
+    game_manager = new_game(5)
+    # Pindahkan player ke monster pertama supaya soal muncul lewat jalur normal
+    player_x, player_y = game_manager.player.get_position()
+    monster_x, monster_y = game_manager.monsters[0].get_position()
+    game_manager.player.move(monster_x - player_x, monster_y - player_y)
+    game_manager.check_collision()
+    if remaining_seconds is not None:
+        game_manager.question_timer = remaining_seconds * game_manager.tick_rate
+    return game_manager
+
+
+def end_state(game_state):
+    game_manager = new_game(3)
+    game_manager.player.gain_score(450)
+    game_manager.monsters_defeated = 12
+    game_manager.game_state = game_state
+    return game_manager
+
+
+# {nama: (draw function, pembuat state)}
+SCENARIOS = {
+    "menu": ("draw_menu", menu_state),
+    "game.10": ("draw_game", lambda: new_game(10)),
+    "game.100": ("draw_game", lambda: new_game(100)),
+    "game.1000": ("draw_game", lambda: new_game(1000)),
+    "game.low_health": ("draw_game", low_health_state),
+    "question": ("draw_question", question_state),
+    "question.low_time": ("draw_question", lambda: question_state(5)),
+    "game_over": ("draw_game_over", lambda: end_state("GAME_OVER")),
+    "win": ("draw_win_screen", lambda: end_state("WIN")),
+}
+
+
+# ===== Benchmark =====
+def wait_for_assets(timeout=10.0):
+    """
+    Tunggu sprite dari background thread supaya semua frame memakai sprite yang sama
+    (juga di mode --shapes: progress loading ikut tergambar di menu)
+    """
+    deadline = time.perf_counter() + timeout
+    while game.assets.is_loading() and time.perf_counter() < deadline:
+        game.assets.poll_loaded()
+        time.sleep(0.005)
+    game.assets.poll_loaded()
+    if game.assets.is_loading():
+        raise RuntimeError(f"Assets still loading after {timeout:.0f} s")
+
+
+def render_frame(draw):
+    """Gambar satu frame seperti main loop. Return ms untuk draw function saja"""
+    game.renderer.begin_frame(game.game_manager.game_state)
+    start = time.perf_counter()
+    draw()
+    elapsed = (time.perf_counter() - start) * 1000
+    game.renderer.present()
+    return elapsed
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[int(p / 100 * (len(values) - 1))]
+
+
+def run_scenario(name, frames, warmup=10):
+    draw_name, make_state = SCENARIOS[name]
+    draw = getattr(game, draw_name)
+    game.game_manager = game.view = make_state()
+    game.previous_positions = {}
+    game.render_alpha = 0.0
+    game.renderer.invalidate()
+
+    for _ in range(warmup):
+        render_frame(draw)
+
+    # Setelah warmup, frame tidak boleh membuat surface baru lagi
+    allocations = game.surface_pool.get_stats()['allocations']
+    timings = []
+    start = time.perf_counter()
+    for _ in range(frames):
+        timings.append(render_frame(draw))
+    total = time.perf_counter() - start
+
+    return {
+        "draw": draw_name,
+        "fps": frames / total,
+        "p50": percentile(timings, 50),
+        "p99": percentile(timings, 99),
+        "allocations": game.surface_pool.get_stats()['allocations'] - allocations,
+    }
+
+
+# ===== Golden frame =====
+def golden_path(name, shapes):
+    return os.path.join(GOLDEN_DIR, f"{name}{'.shapes' if shapes else ''}.png")
+
+
+def render_golden(name):
+    """Gambar ulang scenario dari awal (full redraw) dan return screen"""
+    draw_name, make_state = SCENARIOS[name]
+    game.game_manager = game.view = make_state()
+    game.previous_positions = {}
+    game.render_alpha = 0.0
+    game.renderer.invalidate()
+    render_frame(getattr(game, draw_name))
+    return game.screen
+
+
+def count_different_pixels(surface, golden):
+    """Return jumlah pixel yang berbeda (None = beda ukuran)"""
+    if surface.get_size() != golden.get_size():
+        return None
+    current = pygame.image.tobytes(surface, "RGB")
+    expected = pygame.image.tobytes(golden, "RGB")
+    if current == expected:
+        return 0
+    if numpy is not None:
+        current = numpy.frombuffer(current, dtype=numpy.uint8).reshape(-1, 3)
+        expected = numpy.frombuffer(expected, dtype=numpy.uint8).reshape(-1, 3)
+        return int(numpy.any(current != expected, axis=1).sum())
+    return sum(current[i:i + 3] != expected[i:i + 3] for i in range(0, len(current), 3))
+
+
+def save_golden(names, shapes):
+    os.makedirs(GOLDEN_DIR, exist_ok=True)
+    for name in names:
+        path = golden_path(name, shapes)
+        pygame.image.save(render_golden(name), path)
+        print(f"[OK] Saved {path}")
+
+
+def check_golden(names, shapes):
+    """Return jumlah scenario yang hasilnya berbeda dari golden frame"""
+    failures = 0
+    for name in names:
+        path = golden_path(name, shapes)
+        if not os.path.exists(path):
+            print(f"[!] {name}: no golden frame ({path}), run with --save-golden first")
+            failures += 1
+            continue
+        different = count_different_pixels(render_golden(name), pygame.image.load(path))
+        if different == 0:
+            print(f"[OK] {name}: identical")
+        else:
+            print(f"[X] {name}: {'size differs' if different is None else f'{different} pixels differ'}")
+            failures += 1
+    return failures
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Benchmark render Math Adventure tanpa display")
+    parser.add_argument("scenarios", nargs="*", help=f"scenario (default semua): {', '.join(SCENARIOS)}")
+    parser.add_argument("--frames", type=int, default=300, help="jumlah frame per scenario")
+    parser.add_argument("--shapes", action="store_true", help="tanpa sprite (lingkaran + gradient fallback)")
+    parser.add_argument("--save-golden", action="store_true", help="simpan frame acuan ke folder Golden")
+    parser.add_argument("--check-golden", action="store_true", help="bandingkan dengan frame acuan, exit 1 kalau beda")
+    args = parser.parse_args(argv)
+
+    names = args.scenarios or list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario: {', '.join(unknown)}")
+
+    wait_for_assets()
+    if args.shapes:
+        game.get_sprite = lambda name: None
+
+    if args.save_golden:
+        save_golden(names, args.shapes)
+        return 0
+    if args.check_golden:
+        return 1 if check_golden(names, args.shapes) else 0
+
+    print(f"\n{'scenario':<20} {'draw function':<16} {'fps':>8} {'p50 ms':>8} {'p99 ms':>8} {'allocs':>7}")
+    for name in names:
+        result = run_scenario(name, args.frames)
+        print(f"{name:<20} {result['draw']:<16} {result['fps']:>8.0f} {result['p50']:>8.3f} {result['p99']:>8.3f} {result['allocations']:>7}")
+    print(f"Budget 1 frame di {game.FPS} FPS = {1000 / game.FPS:.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    exit_code = main(sys.argv[1:])
+    game.assets.shutdown()
+    pygame.quit()
+    sys.exit(exit_code)
@@ -0,0 +1,199 @@
+# tools/benchmark_simulation.py
+# Micro-benchmark logika game (headless, tanpa display)
+# Jalankan dari root project:
+#   python -m Tools.benchmark_simulation --save-baseline     (simpan baseline di mesin ini)
+#   python -m Tools.benchmark_simulation                     (bandingkan, exit 1 kalau lebih lambat,
+#                                                             exit 2 kalau belum ada baseline)
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import timeit
+
+from Class.Entity_Store import numpy
+from Class.Game_Manager import GameManager
+from Class.Monster import Monster, Boss
+from Class.Question import Question
+from Class.Save_State import snapshot, restore
+from Tools.benchmark_entity_store import make_horde
+
+DEFAULT_BASELINE = os.path.join("Tools", "benchmark_baseline.json")
+MONSTER_COUNTS = [3, 100, 1000, 10000]
+
+
+def measure(function, target_seconds=0.3, repeat=7):
+    """Return mikrodetik per panggilan (nilai terbaik dari beberapa percobaan)"""
+    number = 1
+    while timeit.timeit(function, number=number) < target_seconds / repeat and number < 1_000_000:
+        number *= 2
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number * 1e6
+
+
+def warmed_up_horde(n_monsters, use_entity_store, ticks=300):
+    """Horde setelah monster sampai di dekat player, supaya setiap update() bebannya sama"""
+    game_manager = make_horde(n_monsters, use_entity_store)
+    game_manager.step(ticks)
+    return game_manager
+
+
+def update_cases(quick):
+    for n_monsters in MONSTER_COUNTS[:2] if quick else MONSTER_COUNTS:
+        yield f"update.objects.{n_monsters}", lambda n=n_monsters: warmed_up_horde(n, False).update
+        if numpy is not None:
+            yield f"update.store.{n_monsters}", lambda n=n_monsters: warmed_up_horde(n, True).update
+
+
+def check_collision_cases(quick):
+    def setup(n_monsters):
+        game_manager = make_horde(n_monsters, False)
+        game_manager.collision_radius = 50
+        # Pindahkan monster yang menyentuh player supaya state tetap PLAYING
+        player_x, player_y = game_manager.player.get_position()
+        for monster in list(game_manager.monsters):
+            monster_x, monster_y = monster.get_position()
+            if (monster_x - player_x)**2 + (monster_y - player_y)**2 < 50**2:
+                game_manager.remove_monster(monster)
+        return game_manager.check_collision
+
+    for n_monsters in MONSTER_COUNTS[:2] if quick else MONSTER_COUNTS:
+        yield f"check_collision.{n_monsters}", lambda n=n_monsters: setup(n)
+
+
+def spawn_monster_cases(quick):
+    def setup():
+        game_manager = GameManager(verbose=False)
+        game_manager.start_game("Bench", seed=0)
+
+        def spawn():
+            game_manager.spawn_monster()
+            game_manager.remove_monster(game_manager.monsters[-1])
+        return spawn
+
+    yield "spawn_monster", setup
+
+
+def question_cases(quick):
+    rng = random.Random(0)
+    monsters = {f"monster.d{difficulty}": Monster("Monster", difficulty, 0, 0) for difficulty in (1, 2, 3)}
+    monsters["boss"] = Boss("Boss", 3, 0, 0)
+    for name, monster in monsters.items():
+        yield f"get_question.{name}", lambda monster=monster: lambda: monster.get_question(rng)
+
+    def setup():
+        samples = [monster.get_question(rng) for monster in monsters.values() for _ in range(250)]
+        index = [0]
+
+        def construct():
+            question_text, answer = samples[index[0] % len(samples)]
+            index[0] += 1
+            Question(question_text, answer, rng)
+        return construct
+
+    yield "question.construct", setup
+
+
+def save_cases(quick):
+    def played_game():
+        game_manager = GameManager(verbose=False)
+        game_manager.start_game("Bench", seed=0)
+        game_manager.step(600)
+        return game_manager
+
+    yield "save.snapshot", lambda: (lambda game_manager=played_game(): snapshot(game_manager))
+    yield "save.restore", lambda: (lambda data=snapshot(played_game()): restore(GameManager(verbose=False), data))
+
+
+def collect_cases(quick):
+    """Return {nama: setup}, setup() membuat state baru dan return fungsi yang diukur"""
+    cases = {}
+    for group in (update_cases, check_collision_cases, spawn_monster_cases, question_cases, save_cases):
+        cases.update(group(quick))
+    return cases
+
+
+def compare(results, baseline, tolerance, cases, retries=2):
+    """
+    Return list benchmark yang lebih lambat dari baseline * (1 + tolerance)
+    Benchmark yang kelihatan lebih lambat diukur ulang dulu (mesin bisa sedang sibuk)
+    """
+    regressions = []
+    print(f"\n{'benchmark':<28} {'baseline us':>12} {'now us':>10} {'change':>8}")
+    for name, value in results.items():
+        old = baseline.get(name)
+        if old is None:
+            print(f"{name:<28} {'-':>12} {value:>10.3f} {'new':>8}")
+            continue
+        for _ in range(retries):
+            if value / old - 1 <= tolerance:
+                break
+            value = min(value, measure(cases[name]()))
+        results[name] = value
+
+        change = value / old - 1
+        flag = ""
+        if change > tolerance:
+            flag = "  <-- REGRESSION"
+            regressions.append(name)
+        print(f"{name:<28} {old:>12.3f} {value:>10.3f} {change:>+7.0%}{flag}")
+    return regressions
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Micro-benchmark simulasi Math Adventure")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="file baseline JSON")
+    parser.add_argument("--save-baseline", action="store_true", help="simpan hasil sebagai baseline baru")
+    parser.add_argument("--output", help="tulis hasil (JSON) ke file ini")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="batas lebih lambat (0.25 = 25%%)")
+    parser.add_argument("--quick", action="store_true", help="lewati ukuran monster yang besar")
+    args = parser.parse_args(argv)
+
+    cases = collect_cases(args.quick)
+    results = {}
+    start = time.perf_counter()
+    for name, setup in cases.items():
+        results[name] = measure(setup())
+    print(f"[OK] {len(results)} benchmarks ({time.perf_counter() - start:.1f} s)")
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": numpy.__version__ if numpy is not None else None,
+            "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "unit": "us_per_call"
+        },
+        "results": results
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        print(f"[OK] Baseline saved: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(json.dumps(results, indent=2))
+        # Tanpa baseline tidak ada yang bisa dibandingkan: gagal, jangan diam-diam lulus
+        print(f"[X] No baseline at {args.baseline}, run with --save-baseline first")
+        return 2
+
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)["results"]
+    regressions = compare(results, baseline, args.tolerance, cases)
+    if regressions:
+        print(f"\n[X] {len(regressions)} benchmark(s) slower than baseline by more than {args.tolerance:.0%}: "
+              + ", ".join(regressions))
+        return 1
+    print("\n[OK] No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,124 @@
+# tools/bot_load.py
+# Load test SessionHost dengan ribuan BotPlayer (tanpa display, tanpa network)
+# Input bot lewat jalur yang sama dengan server.py: Input_Log.encode_frame -> Session.set_input
+# Jalankan dari root project:
+#   python -m Tools.bot_load --bots 1000 --ticks 600
+#   python -m Tools.bot_load --bots 4000 --processes 4     (satu SessionHost per proses)
+import argparse
+import random
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+from Class.Bot_Player import BotPlayer
+from Class.Input_Log import encode_frame
+from Class.Session_Host import SessionHost
+
+TICK_RATE = 60
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[int(p / 100 * (len(values) - 1))] if values else 0.0
+
+
+def run_bots(bots, ticks, seed=0, accuracy=0.8, reaction_mean=2.0, reaction_sd=0.75, tick_rate=TICK_RATE):
+    """Jalankan `bots` sesi selama `ticks` tick secepat mungkin. Return dict hasil (bisa di-pickle)"""
+    host = SessionHost(tick_rate)
+    rng = random.Random(seed)
+
+    # Memori per sesi: GameManager + monster awal + bot, diukur saat dibuat
+    tracemalloc.start()
+    players = []
+    for i in range(bots):
+        session = host.create_session(f"Bot {seed}-{i}", seed=rng.getrandbits(32))
+        players.append((session, BotPlayer(accuracy, reaction_mean, reaction_sd,
+                                           random.Random(rng.getrandbits(32)), tick_rate)))
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    tick_times = []
+    bot_time = 0.0
+    games = wins = 0
+    start = time.perf_counter()
+    for _ in range(ticks):
+        bot_start = time.perf_counter()
+        for session, bot in players:
+            game_manager = session.game_manager
+            if game_manager.game_state in ("GAME_OVER", "WIN"):
+                games += 1
+                wins += game_manager.game_state == "WIN"
+                host.restart_session(session.session_id)
+            keys, answer_index = bot.decide(game_manager)
+            session.set_input(encode_frame(keys, answer_index))
+        bot_time += time.perf_counter() - bot_start
+        tick_times.append(host.step())
+    elapsed = time.perf_counter() - start
+
+    return {
+        'bots': bots,
+        'ticks': ticks,
+        'elapsed': elapsed,
+        'bot_seconds': bot_time,
+        'tick_times': tick_times,
+        'memory': memory,
+        'games': games,
+        'wins': wins,
+        'defeated': sum(session.game_manager.monsters_defeated for session, _ in players),
+    }
+
+
+def run_pool(bots, ticks, processes, seed=0, **options):
+    """Bagi bot ke beberapa proses, masing-masing dengan SessionHost sendiri"""
+    shares = [bots // processes + (i < bots % processes) for i in range(processes)]
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        futures = [pool.submit(run_bots, share, ticks, seed + i, **options) for i, share in enumerate(shares) if share]
+        return [future.result() for future in futures]
+
+
+def report(results, tick_rate=TICK_RATE):
+    bots = sum(result['bots'] for result in results)
+    ticks = results[0]['ticks']
+    elapsed = max(result['elapsed'] for result in results)  # Proses berjalan bersamaan
+    tick_times = [t for result in results for t in result['tick_times']]
+    budget = 1000 / tick_rate
+    p50 = percentile(tick_times, 50)
+    p99 = percentile(tick_times, 99)
+
+    print(f"=== {bots} bots, {ticks} ticks, {len(results)} process(es), {elapsed:.1f} s ===")
+    print(f"  throughput        {bots * ticks / elapsed:,.0f} session-ticks/s "
+          f"({ticks / elapsed:.1f} ticks/s, real time = {tick_rate})")
+    print(f"  tick time         p50 {p50:.2f} ms   p99 {p99:.2f} ms   max {max(tick_times):.2f} ms "
+          f"(budget {budget:.1f} ms)")
+    for result in results:
+        # Perkiraan kapasitas real time per proses dari p99
+        per_session = percentile(result['tick_times'], 99) / max(1, result['bots'])
+        print(f"    {result['bots']:>6} sessions: p99 {per_session * result['bots']:.2f} ms/tick, "
+              f"~{int(budget / per_session) if per_session else 0} sessions fit in {budget:.1f} ms")
+    print(f"  bot decide time   {sum(r['bot_seconds'] for r in results) / max(1, bots * ticks) * 1e6:.2f} us/bot/tick")
+    print(f"  memory/session    {sum(r['memory'] for r in results) / max(1, bots) / 1024:.1f} KiB (traced at creation)")
+    print(f"  finished games    {sum(r['games'] for r in results)} "
+          f"(wins {sum(r['wins'] for r in results)}), monsters defeated {sum(r['defeated'] for r in results)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test SessionHost dengan bot")
+    parser.add_argument("--bots", type=int, default=1000)
+    parser.add_argument("--ticks", type=int, default=600, help="tick simulasi (600 = 10 detik game)")
+    parser.add_argument("--processes", type=int, default=1, help=">1 = ProcessPoolExecutor, satu host per proses")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--accuracy", type=float, default=0.8, help="peluang jawaban benar")
+    parser.add_argument("--reaction-mean", type=float, default=2.0, help="detik sebelum menjawab (rata-rata)")
+    parser.add_argument("--reaction-sd", type=float, default=0.75)
+    args = parser.parse_args()
+
+    options = dict(accuracy=args.accuracy, reaction_mean=args.reaction_mean, reaction_sd=args.reaction_sd)
+    if args.processes > 1:
+        results = run_pool(args.bots, args.ticks, args.processes, args.seed, **options)
+    else:
+        results = [run_bots(args.bots, args.ticks, args.seed, **options)]
+    report(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+# tools/build_atlas.py
+# Build sprite atlas dari Asset/manifest.json (semua sprite sudah di-scale)
+# Jalankan dari root project: python -m Tools.build_atlas
+import json
+import os
+import sys
+
+import pygame
+
+from Class.Asset_Manager import AssetManager, build_atlas
+
+
+def main(argv):
+    asset_dir = argv[0] if argv else "Asset"
+    asset_manager = AssetManager(asset_dir)
+    atlas, index = build_atlas(asset_manager)
+
+    image_path = os.path.join(asset_dir, asset_manager.manifest.get("atlas", "atlas.png"))
+    index_path = os.path.join(asset_dir, asset_manager.manifest.get("atlas_index", "atlas.json"))
+    pygame.image.save(atlas, image_path)
+    with open(index_path, "w", encoding="utf-8") as file:
+        json.dump(index, file, indent=2)
+
+    print(f"[OK] {len(index['entries'])} sprites -> {image_path} {atlas.get_size()}, index -> {index_path}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,40 @@
+# tools/replay.py
+# Jalankan ulang input log secepat mungkin tanpa render, lalu cek checksum
+# Jalankan dari root project: python -m Tools.replay Replay/session_123.malg
+import sys
+import time
+
+from Class.Input_Log import InputLog, replay
+
+
+def main(argv):
+    if not argv:
+        print("Usage: python -m Tools.replay <file.malg> [...]")
+        return 1
+
+    failed = 0
+    for path in argv:
+        log = InputLog.load(path)
+        start = time.perf_counter()
+        game_manager = replay(log)
+        elapsed = time.perf_counter() - start
+
+        checksum = game_manager.checksum()
+        if log.checksum is None:
+            result = "no checksum"
+        elif checksum == log.checksum:
+            result = "MATCH"
+        else:
+            result = f"MISMATCH (expected {log.checksum:08x})"
+            failed += 1
+
+        stats = game_manager.get_game_stats()
+        print(f"{path}: seed={log.seed} frames={len(log)} "
+              f"({len(log) / max(elapsed, 1e-9):.0f} frames/s) state={game_manager.game_state} "
+              f"score={stats['score']} level={stats['level']} checksum={checksum:08x} {result}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,109 @@
+# tools/session_client.py
+# Client pengganti untuk mencoba server.py di localhost (input acak, tanpa display)
+# Jalankan dari root project:
+#   python -m Tools.session_client --local --clients 200     (server ikut jalan di proses ini)
+#   python -m Tools.session_client --port 8765 --clients 200 (ke server.py yang sudah jalan)
+import argparse
+import asyncio
+import random
+import time
+
+from Class.Input_Log import encode_frame
+from Class.Session_Protocol import (MSG_WELCOME, MSG_DELTA, MSG_INPUT, MSG_RESTART, HEADER_SIZE, pack_message,
+                                    read_message, encode_join, decode_welcome, apply_delta)
+from server import GameServer
+
+
+class ClientStats:
+    def __init__(self):
+        self.deltas = 0
+        self.bytes = 0
+        self.errors = 0
+        self.finished_games = 0
+
+
+async def run_client(host, port, seconds, stats, seed):
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(encode_join(f"Client {seed}", seed))
+    message_type, payload = await read_message(reader)
+    if message_type != MSG_WELCOME:
+        stats.errors += 1
+        writer.close()
+        return
+    decode_welcome(payload)
+
+    state = {}
+    last_tick = -1
+    deadline = time.perf_counter() + seconds
+    next_input = 0.0
+    try:
+        while time.perf_counter() < deadline:
+            message_type, payload = await asyncio.wait_for(read_message(reader), timeout=5)
+            if message_type != MSG_DELTA:
+                continue
+            apply_delta(state, payload)
+            stats.deltas += 1
+            stats.bytes += len(payload) + HEADER_SIZE
+            if state['tick'] < last_tick:
+                stats.errors += 1  # Tick harus selalu naik
+            last_tick = state['tick']
+
+            now = time.perf_counter()
+            if state.get('game_state') in ("GAME_OVER", "WIN"):
+                stats.finished_games += 1
+                writer.write(pack_message(MSG_RESTART))
+            elif now >= next_input:
+                # Ganti tombol setiap ~0.2 detik, kadang menjawab soal
+                keys = [rng.random() < 0.3 for _ in range(4)]
+                answer = rng.randrange(4) if state.get('question') and rng.random() < 0.3 else None
+                writer.write(pack_message(MSG_INPUT, bytes((encode_frame(keys, answer),))))
+                next_input = now + 0.2
+    except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+        stats.errors += 1
+    finally:
+        writer.close()
+
+
+async def run(args):
+    server = None
+    port = args.port
+    if args.local:
+        server = GameServer(log=lambda text: None)
+        port = await server.start(args.host, 0)
+
+    stats = ClientStats()
+    start = time.perf_counter()
+    clients = []
+    for i in range(args.clients):
+        clients.append(asyncio.create_task(run_client(args.host, port, args.seconds, stats, seed=i)))
+        if i % 100 == 99:
+            await asyncio.sleep(0)  # Jangan buka ribuan koneksi dalam satu langkah
+    await asyncio.gather(*clients)
+    elapsed = time.perf_counter() - start
+
+    print(f"=== {args.clients} clients, {elapsed:.1f} s ===")
+    print(f"  deltas received   {stats.deltas} ({stats.deltas / elapsed / max(1, args.clients):.1f} /s per client)")
+    print(f"  bytes received    {stats.bytes / 1024:.0f} KiB "
+          f"({stats.bytes / max(1, stats.deltas):.1f} B per delta)")
+    print(f"  finished games    {stats.finished_games}")
+    print(f"  errors            {stats.errors}")
+    if server is not None:
+        print(f"  {server.format_metrics()}")
+        await server.stop()
+    return 1 if stats.errors else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Client pengganti untuk server.py")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--local", action="store_true", help="jalankan server di proses ini (port acak)")
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+# tools/stress_question.py
+# Stress test generator pilihan jawaban: jutaan soal dari Monster dan Boss
+# Jalankan dari root project: python -m Tools.stress_question [jumlah_soal]
+import sys
+import time
+
+from Class.Monster import Monster, Boss
+from Class.Question import Question
+
+
+def main(argv):
+    total = int(argv[0]) if argv else 1_000_000
+    generators = [Monster("Monster", difficulty, 0, 0) for difficulty in (1, 2, 3)]
+    generators.append(Boss("Boss", 3, 0, 0))
+
+    start = time.perf_counter()
+    slowest = 0.0
+    for i in range(total):
+        question_text, answer = generators[i % len(generators)].get_question()
+
+        question_start = time.perf_counter()
+        question = Question(question_text, answer)
+        slowest = max(slowest, time.perf_counter() - question_start)
+
+        options = question.get_options()
+        assert len(options) == 4, (question_text, options)
+        assert len(set(options)) == 4, (question_text, options)
+        assert options.count(answer) == 1, (question_text, options)
+        if answer > 0:
+            assert min(options) > 0, (question_text, options)
+
+    elapsed = time.perf_counter() - start
+    print(f"{total} soal OK dalam {elapsed:.1f} s "
+          f"({elapsed / total * 1e6:.1f} us/soal, terlama {slowest * 1e6:.0f} us)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
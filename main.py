@@ -1,4 +1,7 @@
 # main.py - Version dengan Support Gambar (Fixed Path)
+import time
+STARTUP_TIME = time.perf_counter()  # Awal startup (untuk startup profiler)
+
 import pygame
 import sys
 import os
@@ -6,6 +9,18 @@ import os
 # Check if classes exist
 try:
     from Class.Game_Manager import GameManager
+    from Class.Background_Cache import BackgroundCache
+    from Class.Text_Cache import TextCache
+    from Class.Dirty_Renderer import DirtyRenderer
+    from Class.Input_Log import InputLog
+    from Class.Asset_Manager import AssetManager
+    from Class.Startup_Profiler import StartupProfiler
+    from Class.Frame_Profiler import FrameProfiler
+    from Class.Frame_Governor import FrameGovernor
+    from Class.Surface_Pool import SurfacePool
+    from Class.Sprite_Batch import SpriteBatch
+    from Class.Simulation_Worker import SimulationWorker
+    from Class.Save_State import AutoSave
 except ImportError:
     print("ERROR: Classes not found!")
     print("Please create the following files first:")
@@ -19,28 +34,89 @@ except ImportError:
     input("Press Enter to exit...")
     sys.exit(1)
 
-# Initialize Pygame
-pygame.init()
+startup = StartupProfiler(STARTUP_TIME)
+startup.mark("imports")
 
 # Constants
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
-FPS = 60
+FPS = 60  # Batas frame render
+SIM_TICK_RATE = 60  # Tick simulasi per detik, tetap walaupun FPS turun
+SIM_STEP = 1.0 / SIM_TICK_RATE
+MAX_CATCH_UP_STEPS = 5  # Maks tick per frame, supaya komputer lambat tidak makin tertinggal
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
 RED = (255, 0, 0)
 GREEN = (0, 255, 0)
 BLUE = (0, 100, 255)
+USE_DIRTY_RECTS = True  # False = full flip setiap frame
+RECORD_REPLAY = True  # Simpan input setiap sesi ke folder Replay (python -m Tools.replay)
+REPLAY_DIR = 'Replay'
+LAZY_INIT = True  # Hanya init display + font, sprite game diload saat pertama dipakai
+PROFILE_STARTUP = True  # Tampilkan waktu startup per fase di console
+ASYNC_ASSETS = True  # Decode gambar di background thread, sprite muncul saat sudah siap
+PROFILER_KEY = pygame.K_F3  # Tombol untuk menampilkan frame profiler
+PROFILE_DIR = 'Profile'  # Hasil frame profiler (CSV + JSONL) disimpan di sini saat keluar
+BATCHED_RENDER = False  # draw_game: blit dikumpulkan per layer (entity, latar label, label, HUD)
+SIM_THREAD = False  # Simulasi di thread sendiri, renderer membaca snapshot terbaru
+IDLE_GOVERNOR = True  # Layar statis digambar sekali, loop menunggu input (hemat CPU)
+AUTOSAVE = True  # Simpan progres setiap detik (incremental), tekan C di menu untuk lanjut
+SAVE_PATH = os.path.join('Save', 'autosave.mass')
+
+# Initialize Pygame (mode lazy: subsystem lain seperti audio/joystick tidak dipakai)
+if LAZY_INIT:
+    pygame.display.init()
+    pygame.font.init()
+else:
+    pygame.init()
+startup.mark("pygame init")
 
 # Setup
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Math Adventure")
 clock = pygame.time.Clock()
+startup.mark("display")
+
 font = pygame.font.Font(None, 36)
 small_font = pygame.font.Font(None, 24)
+title_font = pygame.font.Font(None, 72)
+debug_font = pygame.font.Font(None, 18)
+startup.mark("fonts")
 
 # Game Manager
-game_manager = GameManager(SCREEN_WIDTH, SCREEN_HEIGHT)
+game_manager = GameManager(SCREEN_WIDTH, SCREEN_HEIGHT, tick_rate=SIM_TICK_RATE)
+
+# State yang digambar: game_manager sendiri, atau GameSnapshot terbaru kalau SIM_THREAD
+view = game_manager
+sim_worker = None
+
+# Posisi sebelum tick terakhir + fraksi tick, untuk interpolasi gambar
+previous_positions = {}  # {'player' / monster handle: (x, y)}
+render_alpha = 0.0
+
+# Cache background gradient (dipakai kalau Background.png tidak ada)
+background_cache = BackgroundCache()
+
+# Cache teks yang sudah di-render (HUD, label, instruksi)
+text_cache = TextCache()
+
+# Overlay, panel HUD dan latar label dibuat sekali lalu dipakai ulang
+surface_pool = SurfacePool()
+
+# Blit draw_game per layer, dikirim dengan satu Surface.blits() per layer
+sprite_batch = SpriteBatch()
+
+# Hanya area yang berubah yang dikirim ke layar
+renderer = DirtyRenderer(SCREEN_WIDTH, SCREEN_HEIGHT, use_flip=not USE_DIRTY_RECTS)
+
+# Frame profiler (F3), mati secara default
+profiler = FrameProfiler()
+
+# Menu / game over / win digambar sekali, soal hanya saat detik berubah
+governor = FrameGovernor()
+
+# Autosave sesi yang sedang jalan (hanya section yang berubah yang ditulis)
+autosave = AutoSave(SAVE_PATH, every=SIM_TICK_RATE) if AUTOSAVE else None
 
 # ============= LOAD IMAGES =============
 def safe_print(text):
@@ -52,69 +128,83 @@ def safe_print(text):
         text = text.replace('✓', '[OK]').replace('✗', '[X]')
         print(text)
 
-def load_image(filename, size=None):
-    try:
-        path = os.path.join('Asset', 'Image', filename)
-        
-        if not os.path.exists(path):
-            safe_print(f"[!] Image not found: {path}")
-            return None
-            
-        image = pygame.image.load(path).convert_alpha()
-        
-        if size:
-            image = pygame.transform.scale(image, size)
-        
-        safe_print(f"[OK] Loaded: {filename}")
-        return image
-    except pygame.error as e:
-        safe_print(f"[X] Could not load image: {filename}")
-        safe_print(f"    Error: {e}")
-        return None
-
-# Load all images
+# Asset dari Asset/manifest.json (nama file tidak case-sensitive)
+assets = AssetManager('Asset', log=safe_print)
+
+def load_image(name, size=None):
+    """Ambil sprite dari atlas / cache, None kalau gambar tidak ada"""
+    return assets.get(name, size)
+
+SPRITE_SIZES = {
+    'player': (40, 40),
+    'monster': (50, 50),
+    'boss': (70, 70),
+    'background': (SCREEN_WIDTH, SCREEN_HEIGHT)
+}
+
+# {Monster.kind: (sprite, warna fallback, radius)}
+MONSTER_STYLES = {
+    'monster': ('monster', RED, 25),
+    'boss': ('boss', (150, 0, 0), 35)
+}
+
+def get_sprite(name):
+    """Sprite diload saat pertama kali dipakai, setelah itu diambil dari cache"""
+    return load_image(name, SPRITE_SIZES[name])
+
+# Load all images (satu kali decode kalau atlas sudah di-build: python -m Tools.build_atlas)
 safe_print("\n=== Loading Assets ===")
-player_img = load_image('Player.png', (40, 40))      
-monster_img = load_image('Monster.png', (50, 50)) 
-boss_img = load_image('Boss.png', (70, 70))          
-background_img = load_image('Background.png', (SCREEN_WIDTH, SCREEN_HEIGHT))  
+assets.load_atlas()
+if ASYNC_ASSETS:
+    assets.load_async(SPRITE_SIZES)  # Menu tampil duluan, pakai fallback sampai siap
+elif LAZY_INIT:
+    get_sprite('background')  # Hanya yang dibutuhkan menu
+else:
+    for sprite_name in SPRITE_SIZES:
+        get_sprite(sprite_name)
 safe_print("======================\n")
+startup.mark("assets")
 
 def draw_background():
     """Gambar background, fallback ke gradient yang lebih keren jika tidak ada gambar"""
+    background_img = get_sprite('background')
     if background_img:
         screen.blit(background_img, (0, 0))
     else:
-        for y in range(400):
-            # Gradient dari biru langit ke biru muda
-            blue_val = int(135 + (y / 400) * 60)
-            sky_color = (100, blue_val, 255)
-            pygame.draw.line(screen, sky_color, (0, y), (SCREEN_WIDTH, y))
-        
-        # Grass (bawah)
-        for y in range(400, SCREEN_HEIGHT):
-            # Gradient hijau
-            green_val = int(180 - ((y - 400) / 200) * 50)
-            grass_color = (50, green_val, 50)
-            pygame.draw.line(screen, grass_color, (0, y), (SCREEN_WIDTH, y))
-        
-        # Tambah clouds (awan sederhana)
-        cloud_color = (255, 255, 255, 100)
-        cloud_surface = pygame.Surface((100, 40))
-        cloud_surface.set_alpha(100)
-        cloud_surface.fill((255, 255, 255))
-        
-        # Gambar beberapa awan
-        screen.blit(cloud_surface, (100, 80))
-        screen.blit(cloud_surface, (300, 50))
-        screen.blit(cloud_surface, (500, 100))
-        screen.blit(cloud_surface, (650, 70))
+        # Gradient + awan sudah digambar sekali di cache
+        screen.blit(background_cache.get(SCREEN_WIDTH, SCREEN_HEIGHT), (0, 0))
+
+def snapshot_positions():
+    """Simpan posisi sebelum tick simulasi (untuk interpolasi)"""
+    positions = {monster.get_handle(): monster.get_position() for monster in game_manager.monsters}
+    positions['player'] = game_manager.player.get_position()
+    return positions
+
+def get_render_position(key, position):
+    """Posisi di antara tick sebelumnya dan tick sekarang"""
+    previous = previous_positions.get(key)
+    if previous is None:
+        return position
+    x = previous[0] + (position[0] - previous[0]) * render_alpha
+    y = previous[1] + (position[1] - previous[1]) * render_alpha
+    return (int(round(x)), int(round(y)))
+
+def blit(layer, image, position):
+    """Blit langsung, atau dikumpulkan ke sprite_batch kalau BATCHED_RENDER"""
+    if BATCHED_RENDER:
+        sprite_batch.add(layer, image, position)
+    else:
+        screen.blit(image, position)
 
 def draw_entity(image, fallback_color, x, y, size):
     if image:
         # Gambar image dengan center di (x, y)
         rect = image.get_rect(center=(int(x), int(y)))
-        screen.blit(image, rect)
+        blit('entities', image, rect)
+    elif BATCHED_RENDER:
+        # Fallback lingkaran yang sudah di-render, supaya tetap satu blits()
+        circle = surface_pool.get_circle(size, fallback_color)
+        blit('entities', circle, circle.get_rect(center=(int(x), int(y))))
     else:
         # Fallback: gambar lingkaran
         pygame.draw.circle(screen, fallback_color, (int(x), int(y)), size)
@@ -124,14 +214,12 @@ def draw_menu():
     draw_background()
     
     # Semi-transparent overlay
-    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-    overlay.set_alpha(128)
-    overlay.fill(BLACK)
+    overlay = surface_pool.get((SCREEN_WIDTH, SCREEN_HEIGHT), BLACK, 128)
     screen.blit(overlay, (0, 0))
     
     # Title
-    title = font.render("MATH ADVENTURE", True, WHITE)
-    title_shadow = font.render("MATH ADVENTURE", True, BLACK)
+    title = text_cache.render(font, "MATH ADVENTURE", True, WHITE)
+    title_shadow = text_cache.render(font, "MATH ADVENTURE", True, BLACK)
     
     # Center title
     title_rect = title.get_rect(center=(SCREEN_WIDTH//2, 200))
@@ -141,9 +229,9 @@ def draw_menu():
     screen.blit(title, title_rect)
     
     # Instructions - CENTERED
-    subtitle = small_font.render("Tekan SPACE Untuk Mulai", True, WHITE)
-    instructions = small_font.render("Gunakan Tombol Panah Untuk Bergerak", True, WHITE)
-    credits = small_font.render("Jawab Pertanyaan Matematika Untuk Mengalahkan Monster!", True, (200, 200, 200))
+    subtitle = text_cache.render(small_font, "Tekan SPACE Untuk Mulai", True, WHITE)
+    instructions = text_cache.render(small_font, "Gunakan Tombol Panah Untuk Bergerak", True, WHITE)
+    credits = text_cache.render(small_font, "Jawab Pertanyaan Matematika Untuk Mengalahkan Monster!", True, (200, 200, 200))
     
     # Get rect for centering
     subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH//2, 300))
@@ -154,55 +242,72 @@ def draw_menu():
     screen.blit(subtitle, subtitle_rect)
     screen.blit(instructions, instructions_rect)
     screen.blit(credits, credits_rect)
+    
+    if has_saved_game():
+        resume = text_cache.render(small_font, "Tekan C Untuk Lanjut Game Tersimpan", True, GREEN)
+        screen.blit(resume, resume.get_rect(center=(SCREEN_WIDTH//2, 435)))
+    
+    # Progress loading asset (background thread)
+    loaded, total = assets.get_progress()
+    if loaded < total:
+        bar_width = 300
+        bar_x = (SCREEN_WIDTH - bar_width) // 2
+        bar_y = 470
+        pygame.draw.rect(screen, (50, 50, 50), (bar_x, bar_y, bar_width, 10))
+        pygame.draw.rect(screen, GREEN, (bar_x, bar_y, bar_width * loaded // total, 10))
+        pygame.draw.rect(screen, WHITE, (bar_x, bar_y, bar_width, 10), 1)
+        
+        loading = text_cache.render(small_font, f"Loading assets... {loaded}/{total}", True, (200, 200, 200))
+        screen.blit(loading, loading.get_rect(center=(SCREEN_WIDTH//2, bar_y + 25)))
 
 def draw_game():
     """Menggambar game state"""
     draw_background()
     
     # Draw Player
-    player_x, player_y = game_manager.player.get_position()
-    draw_entity(player_img, BLUE, player_x, player_y, 20)
+    player_x, player_y = get_render_position('player', view.player.get_position())
+    draw_entity(get_sprite('player'), BLUE, player_x, player_y, 20)
     
     # Draw player name tag
-    name_text = small_font.render("YOU", True, WHITE)
-    name_bg = pygame.Surface((40, 20))
-    name_bg.fill(BLACK)
-    name_bg.set_alpha(150)
-    screen.blit(name_bg, (player_x - 20, player_y - 40))
-    screen.blit(name_text, (player_x - 15, player_y - 38))
+    name_text = text_cache.render(small_font, "YOU", True, WHITE)
+    name_bg = surface_pool.get((40, 20), BLACK, 150)
+    blit('label_bg', name_bg, (player_x - 20, player_y - 40))
+    blit('labels', name_text, (player_x - 15, player_y - 38))
+    renderer.track('player', (player_x - 20, player_y - 40, 40, 60))
     
     # Draw Monsters
-    for monster in game_manager.monsters:
-        monster_x, monster_y = monster.get_position()
+    for monster in view.monsters:
+        monster_x, monster_y = get_render_position(monster.get_handle(), monster.get_position())
         
-        # Check if it's a Boss
-        is_boss = hasattr(monster, '_Boss__special_ability')
+        # Sprite, warna fallback dan ukuran sesuai jenis monster (Monster.kind)
+        sprite_name, fallback_color, size = MONSTER_STYLES[monster.kind]
+        draw_entity(get_sprite(sprite_name), fallback_color, monster_x, monster_y, size)
         
-        if is_boss:
-            draw_entity(boss_img, (150, 0, 0), monster_x, monster_y, 35)
-            label = small_font.render("BOSS", True, RED)
+        if monster.kind == "boss":
+            label = text_cache.render(small_font, "BOSS", True, RED)
         else:
-            draw_entity(monster_img, RED, monster_x, monster_y, 25)
-            label = small_font.render(f"Lv.{monster.get_difficulty()}", True, WHITE)
+            label = text_cache.render(small_font, f"Lv.{monster.get_difficulty()}", True, WHITE)
         
         # Monster label background
-        label_bg = pygame.Surface((50, 20))
-        label_bg.fill(BLACK)
-        label_bg.set_alpha(150)
-        screen.blit(label_bg, (monster_x - 25, monster_y - 50))
-        screen.blit(label, (monster_x - 20, monster_y - 48))
+        label_bg = surface_pool.get((50, 20), BLACK, 150)
+        blit('label_bg', label_bg, (monster_x - 25, monster_y - 50))
+        blit('labels', label, (monster_x - 20, monster_y - 48))
+        
+        # Area sprite + label
+        renderer.track(('monster', monster.get_handle()), (monster_x - size, monster_y - 50, size * 2, 50 + size))
+    
+    # Semua entity dulu, lalu semua latar label, lalu semua label
+    sprite_batch.flush(screen)
     
     # Draw HUD Panel (Stats)
     panel_height = 180
-    panel = pygame.Surface((250, panel_height))
-    panel.fill((0, 0, 0))
-    panel.set_alpha(180)
+    panel = surface_pool.get((250, panel_height), BLACK, 180)
     screen.blit(panel, (10, 10))
     progress_y = 145
 
     # Progress label
-    progress_label = small_font.render("TO FINAL:", True, (255, 255, 0))
-    screen.blit(progress_label, (20, progress_y))
+    progress_label = text_cache.render(small_font, "TO FINAL:", True, (255, 255, 0))
+    blit('hud', progress_label, (20, progress_y))
 
     # Progress bar
     bar_width = 210
@@ -212,8 +317,8 @@ def draw_game():
     pygame.draw.rect(screen, (50, 50, 50), (bar_x, bar_y, bar_width, bar_height))
 
     # Fill based on level
-    current_level = game_manager.player.get_level()
-    max_level = game_manager.max_level
+    current_level = view.player.get_level()
+    max_level = view.max_level
     fill_percentage = min(current_level / max_level, 1.0)
     fill_width = int(bar_width * fill_percentage)
     
@@ -232,12 +337,12 @@ def draw_game():
     pygame.draw.rect(screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
     
     # Text
-    progress_text = small_font.render(f"Lv {current_level}/{max_level}", True, WHITE)
-    screen.blit(progress_text, (bar_x + 70, bar_y - 2))
+    progress_text = text_cache.render(small_font, f"Lv {current_level}/{max_level}", True, WHITE)
+    blit('hud', progress_text, (bar_x + 70, bar_y - 2))
 
     
     # Draw Stats with better formatting
-    stats = game_manager.get_game_stats()
+    stats = view.get_game_stats()
     
     y_offset = 20
     stats_data = [
@@ -249,20 +354,22 @@ def draw_game():
     ]
     
     for label, value, color in stats_data:
-        label_text = small_font.render(f"{label}:", True, WHITE)
-        value_text = small_font.render(str(value), True, color)
-        screen.blit(label_text, (20, y_offset))
-        screen.blit(value_text, (150, y_offset))
+        label_text = text_cache.render(small_font, f"{label}:", True, WHITE)
+        value_text = text_cache.render(small_font, str(value), True, color)
+        blit('hud', label_text, (20, y_offset))
+        blit('hud', value_text, (150, y_offset))
         y_offset += 25
+    sprite_batch.flush(screen)
+    
+    # HUD hanya berubah kalau stat berubah
+    renderer.track('hud', (10, 10, 250, panel_height), tuple(stats.values()))
 
 def draw_question():
     """Menggambar layar pertanyaan dengan TIMER"""
     draw_background()
     
     # Darken background
-    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-    overlay.set_alpha(200)
-    overlay.fill(BLACK)
+    overlay = surface_pool.get((SCREEN_WIDTH, SCREEN_HEIGHT), BLACK, 200)
     screen.blit(overlay, (0, 0))
     
     # Question box
@@ -276,11 +383,11 @@ def draw_question():
     pygame.draw.rect(screen, WHITE, (box_x, box_y, box_width, box_height), 3)
     
     # Question title
-    title = font.render("SOLVE THIS!", True, (255, 255, 0))
+    title = text_cache.render(font, "SOLVE THIS!", True, (255, 255, 0))
     screen.blit(title, (box_x + 200, box_y + 30))
     
     # TIMER DISPLAY
-    remaining_time = game_manager.get_remaining_time()
+    remaining_time = view.get_remaining_time()
     
     # Timer bar background
     timer_bar_width = 500
@@ -306,15 +413,16 @@ def draw_question():
     pygame.draw.rect(screen, WHITE, (timer_bar_x, timer_bar_y, timer_bar_width, 30), 2)
     
     # Timer text
-    timer_text = small_font.render(f"Time: {remaining_time}s", True, WHITE)
+    timer_text = text_cache.render(small_font, f"Time: {remaining_time}s", True, WHITE)
     screen.blit(timer_text, (box_x + 260, timer_bar_y + 5))
+    renderer.track('timer', (timer_bar_x, timer_bar_y, timer_bar_width, 30), remaining_time)
     
     # Question text
-    question_text = font.render(game_manager.current_question.get_question_text(), True, WHITE)
+    question_text = text_cache.render(font, view.current_question.get_question_text(), True, WHITE)
     screen.blit(question_text, (box_x + 180, box_y + 130))
     
     # Options with better styling
-    options = game_manager.current_question.get_options()
+    options = view.current_question.get_options()
     option_labels = ['1', '2', '3', '4']
     
     for i, (label, option) in enumerate(zip(option_labels, options)):
@@ -326,29 +434,31 @@ def draw_question():
         pygame.draw.rect(screen, WHITE, button_rect, 2)
         
         # Option text
-        option_text = small_font.render(f"[{label}]  {option}", True, WHITE)
+        option_text = text_cache.render(small_font, f"[{label}]  {option}", True, WHITE)
         screen.blit(option_text, (box_x + 120, option_y + 10))
     
     # Instructions
-    instruction = small_font.render("Tekan 1, 2, 3, Atau 4 Untuk Jawab", True, (200, 200, 200))
+    instruction = text_cache.render(small_font, "Tekan 1, 2, 3, Atau 4 Untuk Jawab", True, (200, 200, 200))
     instruction_rect = instruction.get_rect(center=(box_x + box_width//2, box_y + 410))
     screen.blit(instruction, instruction_rect)
+    
+    # Soal baru = seluruh kotak berubah
+    question_signature = (view.current_question.get_question_text(), tuple(options))
+    renderer.track('question', (box_x, box_y, box_width, box_height), question_signature)
 
 def draw_game_over():
     """Menggambar layar game over"""
     draw_background()
     
     # Darken background
-    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-    overlay.set_alpha(200)
-    overlay.fill(BLACK)
+    overlay = surface_pool.get((SCREEN_WIDTH, SCREEN_HEIGHT), BLACK, 200)
     screen.blit(overlay, (0, 0))
     
-    stats = game_manager.get_game_stats()
+    stats = view.get_game_stats()
     
     # Title with shadow effect
-    title_shadow = font.render("GAME OVER", True, BLACK)
-    title = font.render("GAME OVER", True, RED)
+    title_shadow = text_cache.render(font, "GAME OVER", True, BLACK)
+    title = text_cache.render(font, "GAME OVER", True, RED)
     screen.blit(title_shadow, (SCREEN_WIDTH//2 - 98, 152))
     screen.blit(title, (SCREEN_WIDTH//2 - 100, 150))
     
@@ -362,16 +472,16 @@ def draw_game_over():
     pygame.draw.rect(screen, RED, (box_x, box_y, box_width, box_height), 3)
     
     # Final stats
-    score = small_font.render(f"Final Score: {stats['score']}", True, WHITE)
-    level = small_font.render(f"Reached Level: {stats['level']}", True, WHITE)
-    defeated = small_font.render(f"Monsters Defeated: {stats['monsters_defeated']}", True, WHITE)
+    score = text_cache.render(small_font, f"Final Score: {stats['score']}", True, WHITE)
+    level = text_cache.render(small_font, f"Reached Level: {stats['level']}", True, WHITE)
+    defeated = text_cache.render(small_font, f"Monsters Defeated: {stats['monsters_defeated']}", True, WHITE)
     
     screen.blit(score, (box_x + 100, box_y + 40))
     screen.blit(level, (box_x + 100, box_y + 80))
     screen.blit(defeated, (box_x + 100, box_y + 120))
     
     # Restart instruction
-    restart = small_font.render("Tekan R Untuk Restart Atau Q Untuk Keluar", True, (255, 255, 0))
+    restart = text_cache.render(small_font, "Tekan R Untuk Restart Atau Q Untuk Keluar", True, (255, 255, 0))
     restart_rect = restart.get_rect(center=(SCREEN_WIDTH//2, 500))
     screen.blit(restart, restart_rect)
 
@@ -379,22 +489,19 @@ def draw_win_screen():
     draw_background()
     
     # Darken background
-    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-    overlay.set_alpha(200)
-    overlay.fill(BLACK)
+    overlay = surface_pool.get((SCREEN_WIDTH, SCREEN_HEIGHT), BLACK, 200)
     screen.blit(overlay, (0, 0))
     
-    stats = game_manager.get_game_stats()
+    stats = view.get_game_stats()
     
     # Title with gold color
-    title_font = pygame.font.Font(None, 72)
-    title = title_font.render("YOU WIN!", True, (255, 215, 0))
-    title_shadow = title_font.render("YOU WIN!", True, BLACK)
+    title = text_cache.render(title_font, "YOU WIN!", True, (255, 215, 0))
+    title_shadow = text_cache.render(title_font, "YOU WIN!", True, BLACK)
     screen.blit(title_shadow, (SCREEN_WIDTH//2 - 148, 102))
     screen.blit(title, (SCREEN_WIDTH//2 - 150, 100))
     
     # Congratulations message
-    congrats = font.render("CONGRATULATIONS!", True, (255, 255, 0))
+    congrats = text_cache.render(font, "CONGRATULATIONS!", True, (255, 255, 0))
     screen.blit(congrats, (SCREEN_WIDTH//2 - 150, 180))
     
     # Stats box
@@ -418,66 +525,221 @@ def draw_win_screen():
     ]
     
     for text in stats_text:
-        stat_render = small_font.render(text, True, WHITE)
+        stat_render = text_cache.render(small_font, text, True, WHITE)
         screen.blit(stat_render, (box_x + 80, y_offset))
         y_offset += 35
     
     # Victory message
-    victory = small_font.render("You are a Math Master!", True, (255, 255, 0))
+    victory = text_cache.render(small_font, "You are a Math Master!", True, (255, 255, 0))
     screen.blit(victory, (SCREEN_WIDTH//2 - 130, 510))
     
     # Options
-    restart = small_font.render("Tekan R Untuk Main Lagi Atau Q Untuk Keluar", True, (200, 200, 200))
+    restart = text_cache.render(small_font, "Tekan R Untuk Main Lagi Atau Q Untuk Keluar", True, (200, 200, 200))
     restart_rect = restart.get_rect(center=(SCREEN_WIDTH//2, 550))
     screen.blit(restart, restart_rect)
 
+def get_screen_signature():
+    """Nilai yang kalau berubah berarti layar (selain PLAYING) perlu digambar ulang"""
+    if view.game_state == "MENU":
+        return assets.get_progress(), has_saved_game()
+    if view.game_state == "QUESTION":
+        question = view.current_question
+        return (question.get_question_text(), tuple(question.get_options()), view.get_remaining_time())
+    return tuple(view.get_game_stats().values())
+
+DRAW_FUNCTIONS = {
+    "MENU": draw_menu,
+    "PLAYING": draw_game,
+    "QUESTION": draw_question,
+    "WIN": draw_win_screen,
+    "GAME_OVER": draw_game_over
+}
+
+# ============= REPLAY =============
+def save_replay():
+    """Simpan input log sesi yang sedang direkam"""
+    recorder = game_manager.recorder
+    if recorder is None:
+        return
+    game_manager.recorder = None
+    recorder.checksum = game_manager.checksum()
+    
+    try:
+        os.makedirs(REPLAY_DIR, exist_ok=True)
+        path = os.path.join(REPLAY_DIR, f"session_{recorder.seed}.malg")
+        recorder.save(path)
+        safe_print(f"[OK] Replay saved: {path}")
+    except OSError as e:
+        safe_print(f"[X] Could not save replay: {e}")
+
+def save_profile():
+    """Simpan timing frame profiler ke CSV dan JSONL"""
+    if not profiler.has_data():
+        return
+    try:
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        base = os.path.join(PROFILE_DIR, time.strftime("frames_%Y%m%d_%H%M%S"))
+        profiler.export_csv(base + ".csv")
+        profiler.export_jsonl(base + ".jsonl")
+        safe_print(f"[OK] Frame profile saved: {base}.csv / .jsonl")
+    except OSError as e:
+        safe_print(f"[X] Could not save frame profile: {e}")
+
+def start_session():
+    """Mulai game baru (dan mulai rekam input)"""
+    save_replay()
+    if autosave is not None:
+        autosave.discard()
+    game_manager.start_game("Player")
+    previous_positions.clear()
+    if RECORD_REPLAY:
+        game_manager.recorder = InputLog(game_manager.seed, "Player", SCREEN_WIDTH, SCREEN_HEIGHT, SIM_TICK_RATE)
+
+def continue_session():
+    """Lanjutkan game dari autosave (tidak direkam: replay harus mulai dari awal sesi)"""
+    save_replay()
+    try:
+        autosave.load(game_manager)
+    except (OSError, ValueError) as e:
+        safe_print(f"[X] Could not load save: {e}")
+        autosave.discard()
+        return
+    previous_positions.clear()
+    safe_print(f"[OK] Save loaded: {SAVE_PATH}")
+
+def save_finished_replay():
+    """Simpan replay kalau sesi sudah selesai (dipanggil setelah tick simulasi)"""
+    if game_manager.game_state in ("GAME_OVER", "WIN"):
+        save_replay()
+
+# ============= AUTOSAVE =============
+def has_saved_game():
+    return autosave is not None and autosave.exists()
+
+def autosave_step():
+    """Autosave setelah tick simulasi, save dihapus kalau game sudah selesai"""
+    if autosave is None:
+        return
+    try:
+        if game_manager.game_state in ("GAME_OVER", "WIN"):
+            if autosave.exists():
+                autosave.discard()
+        elif game_manager.game_state != "MENU":
+            autosave.tick(game_manager)
+    except OSError as e:
+        safe_print(f"[X] Could not autosave: {e}")
+
+def after_simulation_step():
+    save_finished_replay()
+    autosave_step()
+
+def save_on_exit():
+    """Simpan state terakhir saat keluar di tengah game"""
+    if autosave is None or game_manager.game_state not in ("PLAYING", "QUESTION"):
+        return
+    try:
+        autosave.save(game_manager)
+        safe_print(f"[OK] Game saved: {SAVE_PATH}")
+    except OSError as e:
+        safe_print(f"[X] Could not save game: {e}")
+
+def request_new_session(resume=False):
+    """Mulai game baru (atau lanjut dari save), lewat thread simulasi kalau SIM_THREAD"""
+    session = continue_session if resume else start_session
+    if sim_worker is not None:
+        sim_worker.submit(session)
+    else:
+        session()
+
 # ============= MAIN GAME LOOP =============
-safe_print("\nStarting game...")
-safe_print("If you see 'Image not found' messages above, the game will use colored shapes instead.")
-safe_print("\n")
-
-running = True
-while running:
-    clock.tick(FPS)
-    
-    # Event Handling
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
+# Hanya jalan kalau dijalankan langsung (import main dipakai Tools/benchmark_render.py)
+if __name__ == "__main__":
+    safe_print("\nStarting game...")
+    safe_print("If you see 'Image not found' messages above, the game will use colored shapes instead.")
+    safe_print("\n")
+
+    # Tampilkan menu secepat mungkin (sprite game menyusul saat dipakai)
+    renderer.begin_frame(view.game_state)
+    draw_menu()
+    renderer.present()
+    startup.mark("first menu frame")
+    if PROFILE_STARTUP:
+        for line in startup.report():
+            safe_print(line)
+
+    if SIM_THREAD:
+        # Event kosong untuk membangunkan main loop (event.wait) saat state simulasi berubah
+        SIM_STATE_EVENT = pygame.event.custom_type()
+        sim_worker = SimulationWorker(game_manager, SIM_TICK_RATE, MAX_CATCH_UP_STEPS,
+                                      after_step=after_simulation_step,
+                                      on_state_change=lambda: pygame.event.post(pygame.event.Event(SIM_STATE_EVENT)))
+        sim_worker.start()
+
+    running = True
+    answer_index = None  # Jawaban dipakai di tick berikutnya (hanya tombol pertama)
+    accumulator = 0.0  # Waktu nyata yang belum disimulasikan
+    last_time = time.perf_counter()
+    profiler_frame = 0  # Overlay profiler berubah setiap frame
+    while running:
+        if sim_worker is not None:
+            view = sim_worker.get_snapshot()
+        if (IDLE_GOVERNOR and governor.is_static(view.game_state)
+                and not profiler.enabled and not assets.is_loading()):
+            # Layar statis: tidur sampai ada input, waktu menunggu tidak disimulasikan
+            events = governor.wait_events()
+            last_time = time.perf_counter()
+        else:
+            clock.tick(FPS)
+            events = pygame.event.get()
+        profiler.begin_frame()
+        now = time.perf_counter()
+        accumulator += now - last_time
+        last_time = now
+    
+        # Event Handling
+        for event in events:
+            if event.type == pygame.QUIT:
+                running = False
+        
+            if event.type == pygame.KEYDOWN and event.key == PROFILER_KEY:
+                profiler.toggle()
+                renderer.invalidate()  # Hapus / tampilkan overlay
+                governor.invalidate()
+                continue
         
-        if event.type == pygame.KEYDOWN:
-            # Menu State
-            if game_manager.game_state == "MENU":
-                if event.key == pygame.K_SPACE:
-                    game_manager.start_game("Player")
+            if event.type == pygame.KEYDOWN:
+                # Menu State
+                if view.game_state == "MENU":
+                    if event.key == pygame.K_SPACE:
+                        request_new_session()
+                    elif event.key == pygame.K_c and has_saved_game():
+                        request_new_session(resume=True)
             
-            # Question State
-            elif game_manager.game_state == "QUESTION":
-                options = game_manager.current_question.get_options()
-                if event.key == pygame.K_1 and len(options) > 0:
-                    game_manager.answer_question(options[0])
-                elif event.key == pygame.K_2 and len(options) > 1:
-                    game_manager.answer_question(options[1])
-                elif event.key == pygame.K_3 and len(options) > 2:
-                    game_manager.answer_question(options[2])
-                elif event.key == pygame.K_4 and len(options) > 3:
-                    game_manager.answer_question(options[3])
+                # Question State
+                elif view.game_state == "QUESTION":
+                    answer_keys = [pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4]
+                    if event.key in answer_keys and answer_index is None:
+                        answer_index = answer_keys.index(event.key)
             
-            elif game_manager.game_state == "WIN":
-                if event.key == pygame.K_r:
-                    game_manager.start_game("Player")
-                elif event.key == pygame.K_q:
-                    running = False
+                elif view.game_state == "WIN":
+                    if event.key == pygame.K_r:
+                        request_new_session()
+                    elif event.key == pygame.K_q:
+                        running = False
             
-            # Game Over State
-            elif game_manager.game_state == "GAME_OVER":
-                if event.key == pygame.K_r:
-                    game_manager.start_game("Player")
-                elif event.key == pygame.K_q:
-                    running = False
-    
-    # Player Movement (Playing State)
-    if game_manager.game_state == "PLAYING":
+                # Game Over State
+                elif view.game_state == "GAME_OVER":
+                    if event.key == pygame.K_r:
+                        request_new_session()
+                    elif event.key == pygame.K_q:
+                        running = False
+    
+        # Sprite yang selesai di-decode di background: convert di main thread lalu gambar ulang
+        if assets.poll_loaded():
+            renderer.invalidate()
+            governor.invalidate()
+    
+        # Player Movement (dipakai kalau state PLAYING)
         keys = pygame.key.get_pressed()
         movement = [
             keys[pygame.K_UP],
@@ -485,31 +747,66 @@ while running:
             keys[pygame.K_LEFT],
             keys[pygame.K_RIGHT]
         ]
-        game_manager.player.move_with_keys(movement)
-        
-        # Keep player in bounds
-        x, y = game_manager.player.get_position()
-        x = max(20, min(SCREEN_WIDTH - 20, x))
-        y = max(20, min(SCREEN_HEIGHT - 20, y))
-        game_manager.player._x = x
-        game_manager.player._y = y
-    
-    # Update Game
-    game_manager.update()
-    
-    # Drawing
-    if game_manager.game_state == "MENU":
-        draw_menu()
-    elif game_manager.game_state == "PLAYING":
-        draw_game()
-    elif game_manager.game_state == "QUESTION":
-        draw_question()
-    elif game_manager.game_state == "WIN":
-        draw_win_screen()
-    elif game_manager.game_state == "GAME_OVER":
-        draw_game_over()
-    
-    pygame.display.flip()
-
-pygame.quit()
-sys.exit()
\ No newline at end of file
+    
+        profiler.mark("events")
+    
+        if sim_worker is not None:
+            # Simulasi jalan di thread sendiri: kirim input, gambar snapshot terbaru
+            sim_worker.set_keys(movement)
+            if answer_index is not None:
+                sim_worker.answer(answer_index)
+                answer_index = None
+            previous, view = sim_worker.get_snapshots()
+            previous_positions = previous.get_positions()
+            render_alpha = min(1.0, (time.perf_counter() - view.time) / SIM_STEP)
+        else:
+            # Update Game dengan fixed timestep (jawab soal -> gerak -> update, sama seperti replay)
+            if governor.is_static(game_manager.game_state):
+                accumulator = 0.0
+            else:
+                steps = 0
+                while accumulator >= SIM_STEP and steps < MAX_CATCH_UP_STEPS:
+                    previous_positions = snapshot_positions()
+                    game_manager.step_frame(movement, answer_index)
+                    autosave_step()
+                    answer_index = None
+                    accumulator -= SIM_STEP
+                    steps += 1
+            
+                # Terlalu tertinggal: buang sisa waktu (game melambat, bukan freeze)
+                if accumulator >= SIM_STEP:
+                    accumulator %= SIM_STEP
+            render_alpha = accumulator / SIM_STEP
+            save_finished_replay()
+        profiler.mark("update")
+    
+        # Drawing
+        renderer.begin_frame(view.game_state)
+        draw = DRAW_FUNCTIONS[view.game_state]
+        if IDLE_GOVERNOR and view.game_state != "PLAYING":
+            # Overlay profiler menimpa layar, jadi layar perlu disalin ulang dari cache
+            governor.draw(screen, view.game_state, draw, get_screen_signature(),
+                          restore=profiler.enabled)
+        else:
+            draw()
+            governor.forget_shown()  # Layar cache governor sudah tertimpa
+        profiler.mark(draw.__name__)
+    
+        if profiler.enabled:
+            overlay_rect = profiler.draw_overlay(screen, debug_font)
+            renderer.track('profiler', overlay_rect, profiler_frame)
+            profiler_frame += 1
+            profiler.mark("overlay")
+    
+        renderer.present()
+        profiler.mark("present")
+        profiler.end_frame(view.game_state)
+
+    if sim_worker is not None:
+        sim_worker.stop()
+    save_on_exit()
+    save_replay()
+    save_profile()
+    assets.shutdown()
+    pygame.quit()
+    sys.exit()
\ No newline at end of file
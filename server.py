@@ -0,0 +1,160 @@
+# server.py - Server Math Adventure untuk banyak pemain sekaligus (satu proses, asyncio)
+# Jalankan: python server.py [--host 127.0.0.1] [--port 8765]
+# Client contoh / load test: python -m Tools.session_client --clients 100
+import argparse
+import asyncio
+import time
+from collections import deque
+
+from Class.Session_Host import SessionHost
+from Class.Session_Protocol import (MSG_JOIN, MSG_INPUT, MSG_RESTART, read_message, decode_join,
+                                    encode_welcome)
+
+TICK_RATE = 60
+BATCH_SIZE = 256  # Sesi per batch, di antara batch event loop sempat melayani network
+SEND_EVERY = 1  # Kirim delta setiap N tick (3 = 20 kali/detik, hemat CPU + bandwidth)
+MAX_WRITE_BUFFER = 64 * 1024  # Client yang lambat tidak dikirimi delta sampai buffer-nya turun
+STATS_INTERVAL = 5.0  # Detik antara laporan metrics
+
+
+class GameServer:
+    """
+    Server TCP: setiap koneksi = satu sesi di SessionHost
+    Satu task tick untuk semua sesi, pesan delta dikirim setelah setiap batch
+    """
+
+    def __init__(self, tick_rate=TICK_RATE, batch_size=BATCH_SIZE, send_every=SEND_EVERY, log=print):
+        self.host = SessionHost(tick_rate)
+        self.batch_size = batch_size
+        self.send_every = send_every
+        self.log = log
+        self.__writers = {}  # {id sesi: StreamWriter}
+        self.__handlers = set()  # Task per koneksi, ditunggu saat stop()
+        self.__lateness = deque(maxlen=3600)  # ms tick mulai terlambat dari jadwal
+        self.__bytes_sent = 0
+        self.__server = None
+        self.__tick_task = None
+
+    async def start(self, host="127.0.0.1", port=8765):
+        self.__server = await asyncio.start_server(self.__handle_client, host, port)
+        self.__tick_task = asyncio.create_task(self.__tick_loop())
+        return self.__server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self.__tick_task is not None:
+            self.__tick_task.cancel()
+        if self.__server is not None:
+            self.__server.close()
+            await self.__server.wait_closed()
+        for writer in list(self.__writers.values()):
+            writer.close()
+        if self.__handlers:
+            await asyncio.gather(*self.__handlers, return_exceptions=True)
+
+    async def __handle_client(self, reader, writer):
+        session = None
+        task = asyncio.current_task()
+        self.__handlers.add(task)
+        try:
+            message_type, payload = await read_message(reader)
+            if message_type != MSG_JOIN:
+                return
+            player_name, seed = decode_join(payload)
+            session = self.host.create_session(player_name, seed)
+            self.__writers[session.session_id] = writer
+            writer.write(encode_welcome(session.session_id, session.game_manager.seed))
+
+            while True:
+                message_type, payload = await read_message(reader)
+                if message_type == MSG_INPUT and payload:
+                    session.set_input(payload[0])
+                elif message_type == MSG_RESTART:
+                    self.host.restart_session(session.session_id)
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            if session is not None:
+                self.host.remove_session(session.session_id)
+                self.__writers.pop(session.session_id, None)
+            writer.close()
+            self.__handlers.discard(task)
+
+    async def __tick_loop(self):
+        loop = asyncio.get_running_loop()
+        step = 1.0 / self.host.tick_rate
+        next_tick = loop.time()
+        next_stats = loop.time() + STATS_INTERVAL
+        while True:
+            self.__lateness.append(max(0.0, loop.time() - next_tick) * 1000)
+            start = time.perf_counter()
+            tick = self.host.tick
+            send = tick % self.send_every == 0
+            for batch in self.host.batches(self.batch_size):
+                self.host.step_batch(batch)
+                if send:
+                    self.__send_deltas(batch, tick)
+                await asyncio.sleep(0)
+            self.host.finish_tick(start)
+
+            if loop.time() >= next_stats:
+                self.log(self.format_metrics())
+                next_stats += STATS_INTERVAL
+
+            next_tick += step
+            delay = next_tick - loop.time()
+            if delay < -step:
+                next_tick = loop.time()  # Terlalu tertinggal: lewati tick, jangan menumpuk
+            await asyncio.sleep(max(0.0, delay))
+
+    def __send_deltas(self, sessions, tick):
+        for session in sessions:
+            writer = self.__writers.get(session.session_id)
+            if writer is None or writer.transport.get_write_buffer_size() > MAX_WRITE_BUFFER:
+                continue
+            message = session.make_delta(tick)
+            if message is not None:
+                writer.write(message)
+                self.__bytes_sent += len(message)
+
+    def get_metrics(self):
+        metrics = self.host.get_metrics()
+        lateness = sorted(self.__lateness)
+        if lateness:
+            metrics['late_ms_p50'] = lateness[len(lateness) // 2]
+            metrics['late_ms_p99'] = lateness[int(0.99 * (len(lateness) - 1))]
+        metrics['bytes_sent'] = self.__bytes_sent
+        return metrics
+
+    def format_metrics(self):
+        metrics = self.get_metrics()
+        return (f"[server] sessions={metrics['sessions']} ticks={metrics['ticks']} "
+                f"tick p50={metrics.get('tick_ms_p50', 0):.2f} ms p99={metrics.get('tick_ms_p99', 0):.2f} ms "
+                f"late p99={metrics.get('late_ms_p99', 0):.2f} ms sent={metrics['bytes_sent'] / 1024:.0f} KiB")
+
+
+async def serve(host, port, tick_rate=TICK_RATE, batch_size=BATCH_SIZE, send_every=SEND_EVERY):
+    server = GameServer(tick_rate, batch_size, send_every)
+    port = await server.start(host, port)
+    print(f"Math Adventure server listening on {host}:{port} ({tick_rate} ticks/s)")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Server Math Adventure (banyak sesi, asyncio + TCP)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--tick-rate", type=int, default=TICK_RATE)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--send-every", type=int, default=SEND_EVERY, help="kirim delta setiap N tick")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.tick_rate, args.batch_size, args.send_every))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()